@@ -1,8 +1,23 @@
 """Base packer interface and shared utilities."""
+import heapq
+import time
 from abc import ABC, abstractmethod
+from collections import Counter
 from typing import Dict, List, Tuple, Optional
 
-from ..models import Box, PackingContainer
+from ..models import Box, FreeSpace, PlacedBox, PackingContainer
+
+# Number of free spaces kept per container by the simplified split.
+MAX_SIMPLE_FREE_SPACES = 20
+
+# Minimum number of seconds between console progress updates.
+PROGRESS_INTERVAL = 0.2
+
+
+def _placement_then_volume(space: FreeSpace) -> Tuple[int, int, int, int]:
+    """Sort key ordering spaces by placement key, then by descending volume."""
+    x, y, z = space.position
+    return (z, y, x, -space.volume())
 
 
 class BasePacker(ABC):
@@ -29,6 +44,7 @@ class BasePacker(ABC):
         """
         self.boxes = boxes
         self.container_types = container_types
+        self._next_progress_time = 0.0
 
     @abstractmethod
     def pack(self) -> Optional[Dict]:
@@ -46,6 +62,21 @@ class BasePacker(ABC):
         """
         pass
 
+    def _progress_due(self) -> bool:
+        """Check whether a progress update should be written now.
+
+        Limits console progress output to one update per
+        ``PROGRESS_INTERVAL`` seconds, however often it is polled.
+
+        Returns:
+            True if an update is due, False otherwise
+        """
+        now = time.monotonic()
+        if now < self._next_progress_time:
+            return False
+        self._next_progress_time = now + PROGRESS_INTERVAL
+        return True
+
     def _format_result(self, containers: List[PackingContainer]) -> Dict:
         """Format containers into standard result dictionary.
 
@@ -55,51 +86,48 @@ class BasePacker(ABC):
         Returns:
             Standardized result dictionary
         """
-        result = {
-            'containers': [],
-            'total_containers': len(containers),
-            'container_counts': {},
-            'total_volume_used': 0,
-            'total_volume_available': 0,
-            'overall_utilization': 0.0
-        }
+        container_infos = []
 
         for i, container in enumerate(containers):
-            container_info = {
-                'id': i + 1,
-                'type': container.label,
-                'dimensions': container.dimensions,
-                'volume': container.volume(),
-                'used_volume': container.used_volume(),
-                'utilization': container.utilization(),
-                'boxes': []
-            }
+            volume = container.volume()
+            used_volume = container.used_volume()
+            boxes = []
 
             for placed_box in container.placed_boxes:
-                box_info = {
-                    'label': placed_box.box.label,
-                    'box_id': placed_box.box.box_id,
-                    'original_dimensions': placed_box.box.dimensions,
+                box = placed_box.box
+                boxes.append({
+                    'label': box.label,
+                    'box_id': box.box_id,
+                    'original_dimensions': box.dimensions,
                     'placed_dimensions': placed_box.dimensions,
                     'position': placed_box.position,
-                    'volume': placed_box.box.volume()
-                }
-                container_info['boxes'].append(box_info)
-
-            result['containers'].append(container_info)
-            result['total_volume_used'] += container.used_volume()
-            result['total_volume_available'] += container.volume()
+                    'volume': box.volume()
+                })
 
-            if container.label not in result['container_counts']:
-                result['container_counts'][container.label] = 0
-            result['container_counts'][container.label] += 1
+            container_infos.append({
+                'id': i + 1,
+                'type': container.label,
+                'dimensions': container.dimensions,
+                'volume': volume,
+                'used_volume': used_volume,
+                'utilization': used_volume / volume if volume > 0 else 0.0,
+                'boxes': boxes
+            })
 
-        result['overall_utilization'] = (
-            result['total_volume_used'] / result['total_volume_available']
-            if result['total_volume_available'] > 0 else 0.0
-        )
+        total_volume_used = sum(info['used_volume'] for info in container_infos)
+        total_volume_available = sum(info['volume'] for info in container_infos)
 
-        return result
+        return {
+            'containers': container_infos,
+            'total_containers': len(containers),
+            'container_counts': dict(Counter(c.label for c in containers)),
+            'total_volume_used': total_volume_used,
+            'total_volume_available': total_volume_available,
+            'overall_utilization': (
+                total_volume_used / total_volume_available
+                if total_volume_available > 0 else 0.0
+            )
+        }
 
     def _try_place_in_container(self, box: Box, container: PackingContainer) -> bool:
         """Try to place a box in a container using free space management.
@@ -114,10 +142,115 @@ class BasePacker(ABC):
         rotations = box.get_rotations()
 
         for rotation in rotations:
-            for space in sorted(container.free_spaces,
-                              key=lambda s: (s.position[2], s.position[1], s.position[0])):
+            for space in container.free_spaces:
                 if space.can_fit(rotation):
                     if container.place_box(box, space.position, rotation):
                         return True
 
         return False
+
+    def _try_place_simple(self, box: Box, container: PackingContainer) -> bool:
+        """Try to place a box using simplified free space management.
+
+        Rotations are tried in order against free spaces in placement order,
+        and the box goes in the first space large enough to hold it.
+
+        Args:
+            box: The box to place
+            container: The container to place in
+
+        Returns:
+            True if placement succeeded, False otherwise
+        """
+        free_spaces = container.free_spaces
+
+        # A box fits a space in some rotation exactly when its sorted sides
+        # fit the space's sorted sides; reject it before scanning each rotation
+        a, b, c = sorted(box.dimensions)
+        for space in free_spaces:
+            sa, sb, sc = sorted(space.dimensions)
+            if a <= sa and b <= sb and c <= sc:
+                break
+        else:
+            return False
+
+        for rotation in box.get_rotations():
+            w, d, h = rotation
+            for space in free_spaces:
+                sw, sd, sh = space.dimensions
+                if w <= sw and d <= sd and h <= sh:
+                    self._place_with_simple_update(box, container,
+                                                   space.position, rotation)
+                    return True
+
+        return False
+
+    def _place_with_simple_update(self, box: Box, container: PackingContainer,
+                                  position: Tuple[int, int, int],
+                                  dimensions: Tuple[int, int, int]):
+        """Place a box in a free space and update free spaces.
+
+        The simplified split only ever keeps space that lies beyond the far
+        faces of placed boxes, so free spaces never overlap placed boxes.
+        A box that fits inside a free space at its corner is therefore a
+        valid placement and is not re-checked against the placed boxes.
+
+        Args:
+            box: The box to place
+            container: The container to place in
+            position: Corner (x, y, z) of the free space the box fits in
+            dimensions: Dimensions after rotation (width, depth, height)
+        """
+        placed_box = PlacedBox(box, position, dimensions)
+        container.placed_boxes.append(placed_box)
+
+        self._update_free_spaces_simple(container, placed_box)
+
+    def _update_free_spaces_simple(self, container: PackingContainer,
+                                   placed_box: PlacedBox):
+        """Simplified free space update (3-direction split).
+
+        Each free space intersecting the placed box is split into the slabs
+        above, to the right of and in front of it. Only the largest
+        ``MAX_SIMPLE_FREE_SPACES`` spaces are kept, in placement order.
+
+        Args:
+            container: The container whose free spaces are updated
+            placed_box: The box that was just placed
+        """
+        px, py, pz = placed_box.position
+        pw, pd, ph = placed_box.dimensions
+        px_end = px + pw
+        py_end = py + pd
+        pz_end = pz + ph
+
+        new_spaces = []
+        append = new_spaces.append
+        for space in container.free_spaces:
+            sx, sy, sz = space.position
+            sw, sd, sh = space.dimensions
+            sx_end = sx + sw
+            sy_end = sy + sd
+            sz_end = sz + sh
+
+            if (px >= sx_end or px_end <= sx or
+                    py >= sy_end or py_end <= sy or
+                    pz >= sz_end or pz_end <= sz):
+                append(space)
+                continue
+
+            # Space overlaps - split it
+            if sz_end > pz_end:
+                append(FreeSpace((sx, sy, pz_end), (sw, sd, sz_end - pz_end)))
+            if sx_end > px_end:
+                append(FreeSpace((px_end, sy, sz), (sx_end - px_end, sd, sh)))
+            if sy_end > py_end:
+                append(FreeSpace((sx, py_end, sz), (sw, sy_end - py_end, sh)))
+
+        if len(new_spaces) > MAX_SIMPLE_FREE_SPACES:
+            new_spaces = heapq.nlargest(MAX_SIMPLE_FREE_SPACES, new_spaces,
+                                        key=FreeSpace.volume)
+
+        # Placement order, larger spaces first among those sharing a corner
+        new_spaces.sort(key=_placement_then_volume)
+        container.free_spaces = new_spaces
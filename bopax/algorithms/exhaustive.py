@@ -1,6 +1,5 @@
 """Exhaustive search packing algorithm with backtracking."""
 import sys
-from copy import deepcopy
 from typing import Dict, List, Tuple, Optional
 
 from ..models import Box, PackingContainer
@@ -26,27 +25,99 @@ class ExhaustivePacker(BasePacker):
     ):
         super().__init__(boxes, container_types)
         self.attempts = 0
+        self.max_container_volume = max(
+            (dims[0] * dims[1] * dims[2] for _, dims in container_types),
+            default=0
+        )
 
     def pack(self) -> Optional[Dict]:
         """Find optimal packing configuration using exhaustive search."""
         print(f"Starting exhaustive search for packing {len(self.boxes)} boxes...")
         print(f"Available containers: {[label for label, _ in self.container_types]}")
 
+        if not self.max_container_volume:
+            return None
+
         sorted_boxes = sorted(self.boxes, key=lambda b: b.volume(), reverse=True)
 
-        for max_containers in range(1, len(self.boxes) + 1):
-            print(f"\nTrying with up to {max_containers} containers...")
+        # No solution can use fewer containers than the volume bound
+        min_containers = max(1, self._containers_needed(
+            sum(box.volume() for box in sorted_boxes)))
+
+        # A first-fit packing gives an upper bound, so the smallest feasible
+        # limit can be binary searched between the two bounds
+        max_containers = self._first_fit_container_count(sorted_boxes)
+        if max_containers is None:
+            print("\nSome boxes do not fit in any container")
+            return None
+        max_containers = min(max(max_containers, min_containers), len(self.boxes))
 
-            result = self._try_packing_with_limit(sorted_boxes, max_containers)
+        best_result = None
+        low, high = min_containers, max_containers
+
+        while low <= high:
+            limit = (low + high) // 2
+            result = self._try_limit(sorted_boxes, limit)
 
             if result:
-                print(f"\nFound solution with {len(result['containers'])} containers!")
-                return result
+                best_result = result
+                high = len(result['containers']) - 1
             else:
-                print(f"  No solution with {max_containers} containers "
-                      f"(tried {self.attempts:,} placements)")
+                low = limit + 1
 
-        return None
+        # The backtracking explores different placements than first-fit, so
+        # it may still need more containers than the first-fit bound
+        limit = max_containers + 1
+        while best_result is None and limit <= len(self.boxes):
+            best_result = self._try_limit(sorted_boxes, limit)
+            limit += 1
+
+        if best_result:
+            print(f"\nFound solution with {len(best_result['containers'])} containers!")
+
+        return best_result
+
+    def _try_limit(self, boxes: List[Box], max_containers: int) -> Optional[Dict]:
+        """Run one limited search, reporting the outcome."""
+        print(f"\nTrying with up to {max_containers} containers...")
+
+        result = self._try_packing_with_limit(boxes, max_containers)
+
+        if not result:
+            print(f"  No solution with {max_containers} containers "
+                  f"(tried {self.attempts:,} placements)")
+
+        return result
+
+    def _first_fit_container_count(self, boxes: List[Box]) -> Optional[int]:
+        """Count the containers a first-fit packing uses.
+
+        Each box goes in the first open container with room, otherwise in a
+        new container of the largest type that holds it.
+
+        Returns:
+            Number of containers used, or None if a box fits no container
+        """
+        container_types = sorted(
+            self.container_types,
+            key=lambda x: x[1][0] * x[1][1] * x[1][2],
+            reverse=True
+        )
+        containers = []
+
+        for box in boxes:
+            if any(self._try_place_in_container(box, c) for c in containers):
+                continue
+
+            for label, dims in container_types:
+                new_container = PackingContainer(label, dims)
+                if self._try_place_in_container(box, new_container):
+                    containers.append(new_container)
+                    break
+            else:
+                return None
+
+        return len(containers)
 
     def _try_packing_with_limit(self, boxes: List[Box],
                                 max_containers: int) -> Optional[Dict]:
@@ -54,6 +125,11 @@ class ExhaustivePacker(BasePacker):
         containers = []
         self.attempts = 0
 
+        # suffix_volumes[i] is the total volume of boxes[i:]
+        suffix_volumes = [0] * (len(boxes) + 1)
+        for i in range(len(boxes) - 1, -1, -1):
+            suffix_volumes[i] = suffix_volumes[i + 1] + boxes[i].volume()
+
         def backtrack(box_index: int) -> bool:
             if box_index >= len(boxes):
                 sys.stdout.write(f"\r  Successfully packed all {len(boxes)} boxes!" +
@@ -62,7 +138,7 @@ class ExhaustivePacker(BasePacker):
                 return True
 
             self.attempts += 1
-            if self.attempts % 50 == 0:
+            if self.attempts % 50 == 0 and self._progress_due():
                 progress_pct = (box_index / len(boxes)) * 100
                 box_label = boxes[box_index].label[:20]
                 sys.stdout.write(f"\r  Box {box_index + 1}/{len(boxes)} "
@@ -71,7 +147,11 @@ class ExhaustivePacker(BasePacker):
                                f"Attempts: {self.attempts:,}" + " " * 10)
                 sys.stdout.flush()
 
-            if len(containers) >= max_containers:
+            # Prune when the remaining boxes cannot fit in the spare volume of
+            # the open containers plus the containers still allowed
+            spare_volume = sum(c.volume() - c.used_volume() for c in containers)
+            overflow = suffix_volumes[box_index] - spare_volume
+            if len(containers) + self._containers_needed(overflow) > max_containers:
                 return False
 
             box = boxes[box_index]
@@ -79,10 +159,7 @@ class ExhaustivePacker(BasePacker):
 
             for container in containers:
                 for rotation in rotations:
-                    for free_space in sorted(container.free_spaces,
-                                           key=lambda fs: (fs.position[2],
-                                                          fs.position[1],
-                                                          fs.position[0])):
+                    for free_space in container.free_spaces:
                         if free_space.can_fit(rotation):
                             saved_state = self._save_container_state(container)
 
@@ -117,13 +194,23 @@ class ExhaustivePacker(BasePacker):
 
         return None
 
+    def _containers_needed(self, volume: int) -> int:
+        """Lower bound on the containers needed to hold the given volume."""
+        if volume <= 0:
+            return 0
+        return -(-volume // self.max_container_volume)
+
     def _save_container_state(self, container: PackingContainer) -> Tuple:
-        """Save container state for backtracking."""
-        return (
-            deepcopy(container.placed_boxes),
-            deepcopy(container.free_spaces)
-        )
+        """Save container state for backtracking.
+
+        Placement only appends to ``placed_boxes`` and rebinds
+        ``free_spaces`` to a fresh list, so recording the current length
+        and list reference is enough to undo it.
+        """
+        return (len(container.placed_boxes), container.free_spaces)
 
     def _restore_container_state(self, container: PackingContainer, state: Tuple):
         """Restore container state from saved state."""
-        container.placed_boxes, container.free_spaces = state
+        num_placed, free_spaces = state
+        del container.placed_boxes[num_placed:]
+        container.free_spaces = free_spaces
@@ -1,7 +1,10 @@
 """Hybrid exhaustive-greedy packing algorithm."""
 import sys
 import random
-from copy import deepcopy
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from typing import Dict, List, Tuple, Optional, Set
 
 from ..models import Box, PackingContainer
@@ -25,10 +28,21 @@ class HybridPacker(BasePacker):
         self,
         boxes: List[Box],
         container_types: List[Tuple[str, Tuple[int, int, int]]],
-        max_attempts_per_container: int = 50000
+        max_attempts_per_container: int = 50000,
+        max_workers: int = 1
     ):
+        """Initialize the packer.
+
+        Args:
+            boxes: List of Box objects to pack
+            container_types: List of tuples (label, (width, depth, height))
+            max_attempts_per_container: Search budget for each container trial
+            max_workers: Number of processes used to evaluate container types
+                in parallel; 1 runs them serially in this process
+        """
         super().__init__(boxes, container_types)
         self.max_attempts = max_attempts_per_container
+        self.max_workers = max_workers
 
     def pack(self) -> Optional[Dict]:
         """Pack boxes using hybrid approach."""
@@ -41,52 +55,81 @@ class HybridPacker(BasePacker):
         result_containers = []
         iteration = 1
 
-        while remaining_boxes:
-            print(f"Iteration {iteration}: {len(remaining_boxes)} boxes remaining")
+        executor = (ProcessPoolExecutor(max_workers=self.max_workers)
+                    if self.max_workers > 1 else nullcontext())
 
-            best_container = None
-            best_utilization = 0
-            best_packed_indices = set()
+        with executor:
+            while remaining_boxes:
+                print(f"Iteration {iteration}: {len(remaining_boxes)} boxes remaining")
 
-            for container_label, container_dims in self.container_types:
-                print(f"  Trying {container_label} ({container_dims})...", end="")
-                sys.stdout.flush()
+                best_container = None
+                best_utilization = 0
+                best_packed_indices = set()
 
-                packer = _ExhaustiveContainerPacker(
-                    container_label, container_dims, remaining_boxes,
-                    max_attempts=self.max_attempts
-                )
+                trials = self._evaluate_container_types(remaining_boxes, executor)
 
-                container, packed_indices = packer.find_best_packing()
+                for container_label, container_dims, trial in trials:
+                    print(f"  Trying {container_label} ({container_dims})...", end="")
+                    sys.stdout.flush()
 
-                if container and packed_indices:
-                    util = container.utilization()
-                    print(f" {len(packed_indices)} boxes, {util:.1%} utilization")
+                    container, packed_indices = trial()
 
-                    if util > best_utilization:
-                        best_utilization = util
-                        best_container = container
-                        best_packed_indices = packed_indices
-                else:
-                    print(" No packing found")
+                    if container and packed_indices:
+                        util = container.utilization()
+                        print(f" {len(packed_indices)} boxes, {util:.1%} utilization")
 
-            if best_container and best_packed_indices:
-                result_containers.append(best_container)
-                print(f"  -> Selected: {len(best_packed_indices)} boxes, "
-                      f"{best_utilization:.1%}\n")
+                        if util > best_utilization:
+                            best_utilization = util
+                            best_container = container
+                            best_packed_indices = packed_indices
+                    else:
+                        print(" No packing found")
 
-                remaining_boxes = [box for i, box in enumerate(remaining_boxes)
-                                 if i not in best_packed_indices]
-                iteration += 1
-            else:
-                print("  Could not pack remaining boxes!\n")
-                if not self._greedy_fallback(remaining_boxes, result_containers):
-                    return None
-                break
+                if best_container and best_packed_indices:
+                    result_containers.append(best_container)
+                    print(f"  -> Selected: {len(best_packed_indices)} boxes, "
+                          f"{best_utilization:.1%}\n")
+
+                    remaining_boxes = [box for i, box in enumerate(remaining_boxes)
+                                     if i not in best_packed_indices]
+                    iteration += 1
+                else:
+                    print("  Could not pack remaining boxes!\n")
+                    if not self._greedy_fallback(remaining_boxes, result_containers):
+                        return None
+                    break
 
         print(f"Packed all boxes into {len(result_containers)} containers")
         return self._format_result(result_containers)
 
+    def _evaluate_container_types(self, boxes: List[Box], executor) -> List[Tuple]:
+        """Set up one packing trial per container type.
+
+        When ``executor`` is a process pool all trials are submitted up front
+        and run concurrently; otherwise each trial runs when it is called.
+
+        Args:
+            boxes: Boxes still to be packed
+            executor: ProcessPoolExecutor, or a null context for serial runs
+
+        Returns:
+            List of (label, dimensions, trial) where calling ``trial()``
+            returns the (container, packed_indices) for that container type
+        """
+        trials = []
+
+        for label, dims in self.container_types:
+            args = (label, dims, boxes, self.max_attempts)
+
+            if isinstance(executor, ProcessPoolExecutor):
+                trial = executor.submit(_evaluate_container_type, *args).result
+            else:
+                trial = partial(_evaluate_container_type, *args)
+
+            trials.append((label, dims, trial))
+
+        return trials
+
     def _greedy_fallback(self, remaining_boxes: List[Box],
                          result_containers: List[PackingContainer]) -> bool:
         """Fallback greedy packing for remaining boxes."""
@@ -116,6 +159,22 @@ class HybridPacker(BasePacker):
         return True
 
 
+def _evaluate_container_type(
+    container_label: str,
+    container_dims: Tuple[int, int, int],
+    boxes: List[Box],
+    max_attempts: int
+) -> Tuple[Optional[PackingContainer], Set[int]]:
+    """Find the best single-container packing for one container type.
+
+    Defined at module level so it can be dispatched to worker processes.
+    """
+    packer = _ExhaustiveContainerPacker(
+        container_label, container_dims, boxes, max_attempts=max_attempts
+    )
+    return packer.find_best_packing()
+
+
 class _ExhaustiveContainerPacker:
     """Helper class for exhaustive single-container packing."""
 
@@ -149,38 +208,48 @@ class _ExhaustiveContainerPacker:
         container = PackingContainer(self.container_label, self.container_dims)
         packed_indices = set()
 
+        # All (box, rotation) pairs by descending fit score. The sort is
+        # stable, so ties keep box then rotation order and the first pair
+        # that fits at a position is the best-scoring one.
+        candidates = sorted(
+            ((w * 1000 + d * 10 + h, i, (w, d, h))
+             for i, box in enumerate(self.boxes)
+             for w, d, h in box.get_rotations()),
+            key=lambda candidate: candidate[0],
+            reverse=True
+        )
+
+        container_width, container_depth, container_height = self.container_dims
+
         current_z = 0
         max_layer_height = 0
 
-        while current_z < self.container_dims[2]:
+        while current_z < container_height:
             current_y = 0
 
-            while current_y < self.container_dims[1]:
+            while current_y < container_depth:
                 current_x = 0
                 row_height = 0
 
-                while current_x < self.container_dims[0]:
+                while current_x < container_width:
                     best_box_idx = None
                     best_rotation = None
-                    best_fit_score = 0
 
-                    for i, box in enumerate(self.boxes):
+                    # Space left between this position and the container walls
+                    room_w = container_width - current_x
+                    room_d = container_depth - current_y
+                    room_h = container_height - current_z
+
+                    for _, i, rotation in candidates:
                         if i in packed_indices:
                             continue
 
-                        for rotation in box.get_rotations():
-                            w, d, h = rotation
+                        w, d, h = rotation
 
-                            if (current_x + w <= self.container_dims[0] and
-                                current_y + d <= self.container_dims[1] and
-                                current_z + h <= self.container_dims[2]):
-
-                                fit_score = w * 1000 + d * 10 + h
-
-                                if fit_score > best_fit_score:
-                                    best_fit_score = fit_score
-                                    best_box_idx = i
-                                    best_rotation = rotation
+                        if w <= room_w and d <= room_d and h <= room_h:
+                            best_box_idx = i
+                            best_rotation = rotation
+                            break
 
                     if best_box_idx is not None:
                         box = self.boxes[best_box_idx]
@@ -200,7 +269,7 @@ class _ExhaustiveContainerPacker:
                     else:
                         break
 
-                current_y += row_height if row_height > 0 else self.container_dims[1]
+                current_y += row_height if row_height > 0 else container_depth
 
             if max_layer_height == 0:
                 break
@@ -210,41 +279,58 @@ class _ExhaustiveContainerPacker:
         return container, packed_indices
 
     def _try_greedy_best_fit(self) -> Tuple[Optional[PackingContainer], Set[int]]:
-        """Greedy best-fit strategy."""
+        """Greedy best-fit strategy.
+
+        Repeatedly places the box with the largest utilization gain, i.e.
+        the largest box that still fits. Boxes are tried largest first, so
+        the first box that fits anywhere is the best choice.
+        """
         container = PackingContainer(self.container_label, self.container_dims)
         packed_indices = set()
 
-        while True:
-            positions = self._get_placement_positions(container)
+        positions = _CandidatePositions(self.container_dims)
+        box_order = sorted(range(len(self.boxes)),
+                           key=lambda i: self.boxes[i].volume(),
+                           reverse=True)
 
+        while True:
             best_placement = None
-            best_util_gain = 0
 
-            for i, box in enumerate(self.boxes):
+            for i in box_order:
                 if i in packed_indices:
                     continue
 
-                for rotation in box.get_rotations():
-                    for pos in positions:
-                        if container.can_place_box(rotation, pos):
-                            util_gain = (box.volume() /
-                                        (self.container_dims[0] *
-                                         self.container_dims[1] *
-                                         self.container_dims[2]))
-
-                            if util_gain > best_util_gain:
-                                best_util_gain = util_gain
-                                best_placement = (i, box, pos, rotation)
-
-            if best_placement:
-                idx, box, pos, rotation = best_placement
-                container.place_box(box, pos, rotation)
-                packed_indices.add(idx)
-            else:
+                box = self.boxes[i]
+                best_placement = self._first_fit(container, positions, box)
+
+                if best_placement:
+                    pos, rotation = best_placement
+                    container.place_box(box, pos, rotation)
+                    positions.add_placement(pos, rotation)
+                    packed_indices.add(i)
+                    break
+
+            if not best_placement:
                 break
 
         return container, packed_indices
 
+    def _first_fit(self, container: PackingContainer,
+                   positions: '_CandidatePositions',
+                   box: Box) -> Optional[Tuple[Tuple[int, int, int],
+                                               Tuple[int, int, int]]]:
+        """Find the first rotation and candidate position where a box fits.
+
+        Returns:
+            Tuple of (position, rotation), or None if the box does not fit
+        """
+        for rotation in box.get_rotations():
+            for pos in positions:
+                if container.can_place_box(rotation, pos):
+                    return pos, rotation
+
+        return None
+
     def _try_random_search(self, num_starts: int) -> Tuple[Optional[PackingContainer],
                                                            Set[int]]:
         """Random ordering search strategy."""
@@ -259,54 +345,79 @@ class _ExhaustiveContainerPacker:
 
             container = PackingContainer(self.container_label, self.container_dims)
             packed_indices = set()
+            positions = _CandidatePositions(self.container_dims)
 
             for i in box_indices:
                 box = self.boxes[i]
-                positions = self._get_placement_positions(container)
-
-                placed = False
-                for rotation in box.get_rotations():
-                    for pos in positions:
-                        if container.can_place_box(rotation, pos):
-                            container.place_box(box, pos, rotation)
-                            packed_indices.add(i)
-                            placed = True
-                            break
-                    if placed:
-                        break
+                placement = self._first_fit(container, positions, box)
+
+                if placement:
+                    pos, rotation = placement
+                    container.place_box(box, pos, rotation)
+                    positions.add_placement(pos, rotation)
+                    packed_indices.add(i)
 
+            # Each start builds a fresh container, so the best one can be
+            # kept as-is without copying
             if container.utilization() > best_util:
                 best_util = container.utilization()
-                best_container = deepcopy(container)
-                best_indices = packed_indices.copy()
+                best_container = container
+                best_indices = packed_indices
 
         return best_container, best_indices
 
-    def _get_placement_positions(self, container: PackingContainer) -> List[Tuple[int, int, int]]:
-        """Get candidate positions based on placed boxes."""
-        positions = [(0, 0, 0)]
-
-        for placed in container.placed_boxes:
-            px, py, pz = placed.position
-            pw, pd, ph = placed.dimensions
-
-            positions.extend([
-                (px + pw, py, pz),
-                (px, py + pd, pz),
-                (px, py, pz + ph),
-                (px + pw, py + pd, pz),
-                (px + pw, py, pz + ph),
-                (px, py + pd, pz + ph),
-            ])
-
-        valid_positions = []
-        seen = set()
-        for pos in positions:
-            if (pos not in seen and
-                pos[0] < self.container_dims[0] and
-                pos[1] < self.container_dims[1] and
-                pos[2] < self.container_dims[2]):
-                valid_positions.append(pos)
-                seen.add(pos)
-
-        return sorted(valid_positions, key=lambda p: (p[2], p[1], p[0]))
+
+class _CandidatePositions:
+    """Candidate placement positions for a single container.
+
+    Positions are the container origin plus the corners adjacent to each
+    placed box, de-duplicated, restricted to the container and kept sorted
+    bottom-back-left first. They are maintained incrementally as boxes are
+    placed rather than rebuilt from every placed box.
+    """
+
+    def __init__(self, container_dims: Tuple[int, int, int]):
+        self.container_dims = container_dims
+        self.positions: List[Tuple[int, int, int]] = []
+        self._keys: List[Tuple[int, int, int]] = []
+        self._add((0, 0, 0))
+
+    def __iter__(self):
+        return iter(self.positions)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def add_placement(self, position: Tuple[int, int, int],
+                      dimensions: Tuple[int, int, int]):
+        """Add the candidate positions created by placing a box.
+
+        Args:
+            position: Position (x, y, z) of the placed box
+            dimensions: Placed dimensions (width, depth, height)
+        """
+        px, py, pz = position
+        pw, pd, ph = dimensions
+
+        self._add((px + pw, py, pz))
+        self._add((px, py + pd, pz))
+        self._add((px, py, pz + ph))
+        self._add((px + pw, py + pd, pz))
+        self._add((px + pw, py, pz + ph))
+        self._add((px, py + pd, pz + ph))
+
+    def _add(self, pos: Tuple[int, int, int]):
+        """Insert a position in (z, y, x) order if new and inside the container."""
+        x, y, z = pos
+        if (x >= self.container_dims[0] or
+                y >= self.container_dims[1] or
+                z >= self.container_dims[2]):
+            return
+
+        key = (z, y, x)
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return
+
+        self._keys.insert(index, key)
+        self.positions.insert(index, pos)
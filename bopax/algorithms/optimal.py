@@ -1,10 +1,26 @@
 """Optimal mix search packing algorithm."""
-import sys
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from typing import Dict, List, Tuple, Optional
 
-from ..models import Box, FreeSpace, PlacedBox, PackingContainer
+from ..models import Box, PackingContainer
 from .base import BasePacker
 
+logger = logging.getLogger(__name__)
+
+# Utilization at which the mixed strategy stops trying further container types
+MIXED_UTILIZATION_TARGET = 0.9
+
+# (progress message, strategy name) in the order strategies are compared
+STRATEGIES = (
+    ("Strategy 1: Largest containers first...", "largest"),
+    ("Strategy 2: Smallest containers first...", "smallest"),
+    ("Strategy 3: Best-fit strategy...", "bestfit"),
+    ("Strategy 4: Mixed container sizes...", "mixed"),
+)
+
 
 class OptimalPacker(BasePacker):
     """Optimal mix search packing algorithm.
@@ -21,80 +37,105 @@ class OptimalPacker(BasePacker):
     def __init__(
         self,
         boxes: List[Box],
-        container_types: List[Tuple[str, Tuple[int, int, int]]]
+        container_types: List[Tuple[str, Tuple[int, int, int]]],
+        max_workers: int = 1
     ):
+        """Initialize the packer.
+
+        Args:
+            boxes: List of Box objects to pack
+            container_types: List of tuples (label, (width, depth, height))
+            max_workers: Number of processes used to run the strategies in
+                parallel; 1 runs them serially in this process
+        """
         super().__init__(boxes, container_types)
+        self.max_workers = max_workers
         self.container_types_sorted = sorted(
             container_types,
             key=lambda x: x[1][0] * x[1][1] * x[1][2],
             reverse=True
         )
+        self._best_fit_orders: Dict[Tuple[int, int, int],
+                                    List[Tuple[str, Tuple[int, int, int]]]] = {}
 
     def pack(self) -> Optional[Dict]:
         """Find optimal packing by trying different strategies."""
-        print(f"Finding optimal packing for {len(self.boxes)} boxes...")
-        print(f"Available containers: {[label for label, _ in self.container_types]}\n")
+        logger.info("Finding optimal packing for %d boxes...", len(self.boxes))
+        logger.info("Available containers: %s",
+                    [label for label, _ in self.container_types])
 
         # Handle empty boxes case
         if not self.boxes:
             return self._format_result([])
 
+        # Every strategy fails if some box fits no container type, so check
+        # that up front rather than running all four.
+        if any(not self._get_best_fit_order(box) for box in self.boxes):
+            logger.info("No valid packing found")
+            return None
+
         sorted_boxes = sorted(self.boxes, key=lambda b: b.volume(), reverse=True)
 
         best_result = None
         best_utilization = 0
 
-        # Strategy 1: Prefer largest containers
-        print("Strategy 1: Largest containers first...")
-        result1 = self._pack_with_preference(sorted_boxes, "largest")
-        if result1:
-            util1 = result1['overall_utilization']
-            print(f"  Result: {result1['total_containers']} containers, "
-                  f"{util1:.1%} utilization\n")
-            if util1 > best_utilization:
-                best_result = result1
-                best_utilization = util1
-
-        # Strategy 2: Prefer smallest containers
-        print("Strategy 2: Smallest containers first...")
-        result2 = self._pack_with_preference(sorted_boxes, "smallest")
-        if result2:
-            util2 = result2['overall_utilization']
-            print(f"  Result: {result2['total_containers']} containers, "
-                  f"{util2:.1%} utilization\n")
-            if util2 > best_utilization:
-                best_result = result2
-                best_utilization = util2
-
-        # Strategy 3: Best-fit
-        print("Strategy 3: Best-fit strategy...")
-        result3 = self._pack_with_preference(sorted_boxes, "bestfit")
-        if result3:
-            util3 = result3['overall_utilization']
-            print(f"  Result: {result3['total_containers']} containers, "
-                  f"{util3:.1%} utilization\n")
-            if util3 > best_utilization:
-                best_result = result3
-                best_utilization = util3
-
-        # Strategy 4: Mixed approach
-        print("Strategy 4: Mixed container sizes...")
-        result4 = self._pack_with_mixed_strategy(sorted_boxes)
-        if result4:
-            util4 = result4['overall_utilization']
-            print(f"  Result: {result4['total_containers']} containers, "
-                  f"{util4:.1%} utilization\n")
-            if util4 > best_utilization:
-                best_result = result4
-                best_utilization = util4
+        executor = (ProcessPoolExecutor(max_workers=self.max_workers)
+                    if self.max_workers > 1 else nullcontext())
+
+        with executor:
+            runs = self._start_strategies(sorted_boxes, executor)
+
+            for description, run in runs:
+                logger.info(description)
+                result = run()
+                if result:
+                    util = result['overall_utilization']
+                    logger.info("  Result: %d containers, %.1f%% utilization",
+                                result['total_containers'], util * 100)
+                    if util > best_utilization:
+                        best_result = result
+                        best_utilization = util
 
         if best_result:
-            print(f"Best strategy achieved {best_utilization:.1%} utilization")
+            logger.info("Best strategy achieved %.1f%% utilization",
+                        best_utilization * 100)
             return best_result
         else:
-            print("No valid packing found")
+            logger.info("No valid packing found")
             return None
 
+    def _start_strategies(self, boxes: List[Box], executor) -> List[Tuple]:
+        """Set up one run per packing strategy.
+
+        When ``executor`` is a process pool all strategies are submitted up
+        front and run concurrently; otherwise each runs when it is called.
+
+        Args:
+            boxes: Boxes to pack, largest first
+            executor: ProcessPoolExecutor, or a null context for serial runs
+
+        Returns:
+            List of (description, run) where calling ``run()`` returns the
+            strategy's result dictionary or None
+        """
+        runs = []
+
+        for description, strategy in STRATEGIES:
+            if isinstance(executor, ProcessPoolExecutor):
+                run = executor.submit(self._run_strategy, boxes, strategy).result
+            else:
+                run = partial(self._run_strategy, boxes, strategy)
+
+            runs.append((description, run))
+
+        return runs
+
+    def _run_strategy(self, boxes: List[Box], strategy: str) -> Optional[Dict]:
+        """Pack boxes with one of the strategies in ``STRATEGIES``."""
+        if strategy == "mixed":
+            return self._pack_with_mixed_strategy(boxes)
+        return self._pack_with_preference(boxes, strategy)
+
     def _pack_with_preference(self, boxes: List[Box],
                                preference: str) -> Optional[Dict]:
         """Pack boxes with a specific container size preference."""
@@ -104,7 +145,7 @@ class OptimalPacker(BasePacker):
             placed = False
 
             for container in containers:
-                if self._try_place_optimal(box, container):
+                if self._try_place_simple(box, container):
                     placed = True
                     break
 
@@ -118,7 +159,7 @@ class OptimalPacker(BasePacker):
 
                 for label, dims in container_order:
                     new_container = PackingContainer(label, dims)
-                    if self._try_place_optimal(box, new_container):
+                    if self._try_place_simple(box, new_container):
                         containers.append(new_container)
                         placed = True
                         break
@@ -129,111 +170,75 @@ class OptimalPacker(BasePacker):
         return self._format_result(containers)
 
     def _pack_with_mixed_strategy(self, boxes: List[Box]) -> Optional[Dict]:
-        """Pack using a mixed strategy that adapts container size."""
+        """Pack using a mixed strategy that adapts container size.
+
+        Each round fills one container of every type, largest first, with
+        the remaining boxes and keeps the best-utilized one. A round stops
+        early once a container reaches ``MIXED_UTILIZATION_TARGET``.
+        """
         containers = []
         remaining_boxes = boxes.copy()
 
         while remaining_boxes:
             best_container = None
-            best_boxes = []
+            best_packed_indices = set()
             best_utilization = 0
 
             for label, dims in self.container_types_sorted:
                 container = PackingContainer(label, dims)
-                packed_boxes = []
+                packed_indices = set()
 
-                for box in remaining_boxes:
-                    if self._try_place_optimal(box, container):
-                        packed_boxes.append(box)
+                for i, box in enumerate(remaining_boxes):
+                    if self._try_place_simple(box, container):
+                        packed_indices.add(i)
 
-                if packed_boxes:
+                if packed_indices:
                     util = container.utilization()
                     if util > best_utilization:
                         best_container = container
-                        best_boxes = packed_boxes
+                        best_packed_indices = packed_indices
                         best_utilization = util
 
-            if best_container and best_boxes:
+                # Near-full containers are unlikely to be beaten by the
+                # smaller types still to come
+                if best_utilization >= MIXED_UTILIZATION_TARGET:
+                    break
+
+            if best_container and best_packed_indices:
                 containers.append(best_container)
-                for box in best_boxes:
-                    remaining_boxes.remove(box)
+                remaining_boxes = [box for i, box in enumerate(remaining_boxes)
+                                   if i not in best_packed_indices]
             else:
                 return None
 
         return self._format_result(containers)
 
     def _get_best_fit_order(self, box: Box) -> List[Tuple[str, Tuple[int, int, int]]]:
-        """Get container types ordered by best fit for the box."""
+        """Get container types ordered by best fit for the box.
+
+        The order only depends on the box's dimensions up to rotation, so it
+        is computed once per distinct shape and reused.
+        """
+        shape = tuple(sorted(box.dimensions))
+        cached = self._best_fit_orders.get(shape)
+        if cached is not None:
+            return cached
+
         box_vol = box.volume()
+        rotations = box.get_rotations()
         container_with_fit = []
 
         for label, dims in self.container_types:
             container_vol = dims[0] * dims[1] * dims[2]
             can_fit = any(
                 rot[0] <= dims[0] and rot[1] <= dims[1] and rot[2] <= dims[2]
-                for rot in box.get_rotations()
+                for rot in rotations
             )
             if can_fit:
                 waste = container_vol - box_vol
                 container_with_fit.append((waste, label, dims))
 
         container_with_fit.sort(key=lambda x: x[0])
-        return [(label, dims) for _, label, dims in container_with_fit]
-
-    def _try_place_optimal(self, box: Box, container: PackingContainer) -> bool:
-        """Try to place a box with simplified free space management."""
-        rotations = box.get_rotations()
-
-        for rotation in rotations:
-            for space in sorted(container.free_spaces,
-                              key=lambda s: (s.position[2], s.position[1], s.position[0])):
-                if space.can_fit(rotation):
-                    if self._place_with_simple_update(box, container,
-                                                       space.position, rotation):
-                        return True
-
-        return False
-
-    def _place_with_simple_update(self, box: Box, container: PackingContainer,
-                                   position: Tuple[int, int, int],
-                                   dimensions: Tuple[int, int, int]) -> bool:
-        """Place box and update free spaces."""
-        if not container.can_place_box(dimensions, position):
-            return False
-
-        placed_box = PlacedBox(box, position, dimensions)
-        container.placed_boxes.append(placed_box)
-
-        px, py, pz = position
-        pw, pd, ph = dimensions
-
-        new_spaces = []
-        for space in container.free_spaces:
-            sx, sy, sz = space.position
-            sw, sd, sh = space.dimensions
-
-            if not (px >= sx + sw or px + pw <= sx or
-                   py >= sy + sd or py + pd <= sy or
-                   pz >= sz + sh or pz + ph <= sz):
-                if sz + sh > pz + ph:
-                    new_spaces.append(FreeSpace(
-                        (sx, sy, pz + ph),
-                        (sw, sd, sz + sh - (pz + ph))
-                    ))
-                if sx + sw > px + pw:
-                    new_spaces.append(FreeSpace(
-                        (px + pw, sy, sz),
-                        (sx + sw - (px + pw), sd, sh)
-                    ))
-                if sy + sd > py + pd:
-                    new_spaces.append(FreeSpace(
-                        (sx, py + pd, sz),
-                        (sw, sy + sd - (py + pd), sh)
-                    ))
-            else:
-                new_spaces.append(space)
-
-        new_spaces.sort(key=lambda s: s.volume(), reverse=True)
-        container.free_spaces = new_spaces[:20]
-
-        return True
+        order = [(label, dims) for _, label, dims in container_with_fit]
+        self._best_fit_orders[shape] = order
+        return order
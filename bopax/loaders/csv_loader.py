@@ -1,13 +1,27 @@
 """CSV data loaders for BoPax."""
 import csv
 import math
-from typing import List, Tuple, Optional
+import os
+from contextlib import nullcontext
+from typing import List, Tuple, Optional, TextIO, Union
 
 from ..models import Box
 
+CSVSource = Union[str, os.PathLike, TextIO]
+
+
+def _open_csv(source: CSVSource):
+    """Open a CSV file path, or pass an already-open text stream through.
+
+    Streams are not closed when the returned context exits.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, 'r')
+    return nullcontext(source)
+
 
 def load_boxes_from_csv(
-    filename: str,
+    filename: CSVSource,
     exclude_labels: Optional[List[str]] = None
 ) -> List[Box]:
     """Load boxes to pack from a CSV file.
@@ -16,7 +30,7 @@ def load_boxes_from_csv(
         Box Label,Count,Dim 1 (mm),Dim 2.  (mm),Dim 3 (mm)
 
     Args:
-        filename: Path to the CSV file
+        filename: Path to the CSV file, or an open text stream
         exclude_labels: Optional list of box labels to skip
 
     Returns:
@@ -24,14 +38,14 @@ def load_boxes_from_csv(
     """
     boxes = []
     box_id = 1
-    exclude_labels = exclude_labels or []
+    excluded = set(exclude_labels or ())
 
-    with open(filename, 'r') as f:
+    with _open_csv(filename) as f:
         reader = csv.DictReader(f)
         for row in reader:
             label = row['Box Label']
 
-            if label in exclude_labels:
+            if label in excluded:
                 continue
 
             count = int(row['Count'])
@@ -39,15 +53,15 @@ def load_boxes_from_csv(
             dim2 = math.ceil(float(row['Dim 2.  (mm)']))
             dim3 = math.ceil(float(row['Dim 3 (mm)']))
 
-            for _ in range(count):
-                boxes.append(Box(label, (dim1, dim2, dim3), box_id))
-                box_id += 1
+            dims = (dim1, dim2, dim3)
+            boxes.extend(Box(label, dims, box_id + i) for i in range(count))
+            box_id += max(count, 0)
 
     return boxes
 
 
 def load_containers_from_csv(
-    filename: str
+    filename: CSVSource
 ) -> List[Tuple[str, Tuple[int, int, int]]]:
     """Load container types from a CSV file.
 
@@ -55,14 +69,14 @@ def load_containers_from_csv(
         Box Label,Dim 1 (mm),Dim 2.  (mm),Dim 3 (mm)
 
     Args:
-        filename: Path to the CSV file
+        filename: Path to the CSV file, or an open text stream
 
     Returns:
         List of tuples (label, (width, depth, height))
     """
     containers = []
 
-    with open(filename, 'r') as f:
+    with _open_csv(filename) as f:
         reader = csv.DictReader(f)
         for row in reader:
             label = row['Box Label']
@@ -1,12 +1,40 @@
 """Box model classes for 3D bin packing."""
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import cached_property, lru_cache
+from typing import Tuple
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _unique_rotations(dimensions: Tuple[int, int, int]) -> Tuple[Tuple[int, int, int], ...]:
+    """Return the unique rotations for a dimension triple.
+
+    Shared by every Box with the same dimensions, e.g. all copies of a box
+    type loaded from CSV. Boxes with equal sides have fewer distinct
+    rotations; each case lists them in the same order as the general one.
+    """
+    w, d, h = dimensions
+    if w == d == h:
+        return ((w, d, h),)
+    if w == d:
+        return ((w, w, h), (w, h, w), (h, w, w))
+    if w == h:
+        return ((w, d, w), (w, w, d), (d, w, w))
+    if d == h:
+        return ((w, d, d), (d, w, d), (d, d, w))
+    return (
+        (w, d, h), (w, h, d),
+        (d, w, h), (d, h, w),
+        (h, w, d), (h, d, w)
+    )
+
+
+@dataclass(eq=False)
 class Box:
     """Represents a box to be packed.
 
+    Each instance is a distinct physical box, so boxes compare and hash by
+    identity rather than by field values.
+
     Attributes:
         label: Name/identifier for the box type
         dimensions: Tuple of (width, depth, height) in mm
@@ -16,29 +44,31 @@ class Box:
     dimensions: Tuple[int, int, int]
     box_id: int = 0
 
-    def volume(self) -> int:
-        """Calculate box volume in cubic mm."""
+    @cached_property
+    def _volume(self) -> int:
+        """Volume in cubic mm, computed on first access."""
         return self.dimensions[0] * self.dimensions[1] * self.dimensions[2]
 
-    def get_rotations(self) -> List[Tuple[int, int, int]]:
+    def volume(self) -> int:
+        """Calculate box volume in cubic mm (computed once per box)."""
+        return self._volume
+
+    @cached_property
+    def unique_rotations(self) -> Tuple[Tuple[int, int, int], ...]:
+        """All unique rotations of the box (up to 6), computed once.
+
+        A cube has a single rotation and a box with a square face has three,
+        so callers iterating rotations skip symmetric duplicates.
+        """
+        return _unique_rotations(tuple(self.dimensions))
+
+    def get_rotations(self) -> Tuple[Tuple[int, int, int], ...]:
         """Return all unique rotations of the box (up to 6).
 
         Returns:
-            List of dimension tuples representing unique orientations.
+            Tuple of dimension tuples representing unique orientations.
         """
-        w, d, h = self.dimensions
-        rotations = [
-            (w, d, h), (w, h, d),
-            (d, w, h), (d, h, w),
-            (h, w, d), (h, d, w)
-        ]
-        seen = set()
-        unique = []
-        for rot in rotations:
-            if rot not in seen:
-                seen.add(rot)
-                unique.append(rot)
-        return unique
+        return self.unique_rotations
 
 
 @dataclass
@@ -50,6 +80,8 @@ class PlacedBox:
         position: Tuple of (x, y, z) coordinates for placement
         dimensions: Actual dimensions after rotation (width, depth, height)
     """
+    __slots__ = ('box', 'position', 'dimensions')
+
     box: Box
     position: Tuple[int, int, int]
     dimensions: Tuple[int, int, int]
@@ -73,11 +105,11 @@ class PlacedBox:
         Returns:
             True if the boxes overlap, False otherwise
         """
-        b1 = self.get_bounds()
-        b2 = other.get_bounds()
-
-        x_overlap = b1[0][0] < b2[0][1] and b1[0][1] > b2[0][0]
-        y_overlap = b1[1][0] < b2[1][1] and b1[1][1] > b2[1][0]
-        z_overlap = b1[2][0] < b2[2][1] and b1[2][1] > b2[2][0]
-
-        return x_overlap and y_overlap and z_overlap
+        x1, y1, z1 = self.position
+        w1, d1, h1 = self.dimensions
+        x2, y2, z2 = other.position
+        w2, d2, h2 = other.dimensions
+
+        return (x1 < x2 + w2 and x1 + w1 > x2 and
+                y1 < y2 + d2 and y1 + d1 > y2 and
+                z1 < z2 + h2 and z1 + h1 > z2)
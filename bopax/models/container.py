@@ -1,6 +1,9 @@
 """Container model classes for 3D bin packing."""
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from functools import cached_property
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from .box import Box, PlacedBox
 
@@ -13,12 +16,22 @@ class FreeSpace:
         position: Tuple of (x, y, z) coordinates for the corner
         dimensions: Tuple of (width, depth, height) in mm
     """
+    __slots__ = ('position', 'dimensions', '_volume')
+
     position: Tuple[int, int, int]
     dimensions: Tuple[int, int, int]
 
+    def __post_init__(self):
+        self._volume = self.dimensions[0] * self.dimensions[1] * self.dimensions[2]
+
     def volume(self) -> int:
-        """Calculate the volume of this free space."""
-        return self.dimensions[0] * self.dimensions[1] * self.dimensions[2]
+        """Return the volume of this free space (computed on creation)."""
+        return self._volume
+
+    def placement_key(self) -> Tuple[int, int, int]:
+        """Return the (z, y, x) key used to order spaces for placement."""
+        x, y, z = self.position
+        return (z, y, x)
 
     def can_fit(self, box_dims: Tuple[int, int, int]) -> bool:
         """Check if a box with given dimensions can fit in this space.
@@ -42,7 +55,8 @@ class PackingContainer:
         label: Name/identifier for the container type
         dimensions: Tuple of (width, depth, height) in mm
         placed_boxes: List of boxes placed in this container
-        free_spaces: List of available free spaces
+        free_spaces: List of available free spaces, ordered bottom-back-left
+            first (see FreeSpace.placement_key)
     """
     label: str
     dimensions: Tuple[int, int, int]
@@ -52,11 +66,18 @@ class PackingContainer:
     def __post_init__(self):
         if not self.free_spaces:
             self.free_spaces = [FreeSpace((0, 0, 0), self.dimensions)]
+        else:
+            self.free_spaces = sorted(self.free_spaces, key=FreeSpace.placement_key)
 
-    def volume(self) -> int:
-        """Calculate the total volume of the container."""
+    @cached_property
+    def _volume(self) -> int:
+        """Volume in cubic mm, computed on first access."""
         return self.dimensions[0] * self.dimensions[1] * self.dimensions[2]
 
+    def volume(self) -> int:
+        """Calculate the total volume of the container (computed once)."""
+        return self._volume
+
     def used_volume(self) -> int:
         """Calculate the volume used by placed boxes."""
         return sum(pb.box.volume() for pb in self.placed_boxes)
@@ -87,11 +108,18 @@ class PackingContainer:
         if x < 0 or y < 0 or z < 0:
             return False
 
-        temp_box = Box("temp", box_dims)
-        temp_placed = PlacedBox(temp_box, position, box_dims)
+        x_end = x + w
+        y_end = y + d
+        z_end = z + h
 
         for placed_box in self.placed_boxes:
-            if temp_placed.overlaps(placed_box):
+            px, py, pz = placed_box.position
+            pw, pd, ph = placed_box.dimensions
+
+            # Boxes are mostly stacked in layers, so z rejects most pairs
+            if (z < pz + ph and z_end > pz and
+                    y < py + pd and y_end > py and
+                    x < px + pw and x_end > px):
                 return False
 
         return True
@@ -122,27 +150,37 @@ class PackingContainer:
             self.placed_boxes.pop()
 
     def _update_free_spaces(self, placed_box: PlacedBox):
-        """Update free spaces after placing a box using guillotine splitting."""
+        """Update free spaces after placing a box using guillotine splitting.
+
+        Spaces that do not intersect the box are kept as they are. Only the
+        pieces split off intersecting spaces need pruning, since the
+        untouched spaces were already pruned against each other.
+        """
         new_free_spaces = []
+        split_indices = []
         px, py, pz = placed_box.position
         pw, pd, ph = placed_box.dimensions
+        px_end = px + pw
+        py_end = py + pd
+        pz_end = pz + ph
 
         for free_space in self.free_spaces:
             fx, fy, fz = free_space.position
             fw, fd, fh = free_space.dimensions
 
-            if not self._boxes_intersect(
-                (px, py, pz, pw, pd, ph),
-                (fx, fy, fz, fw, fd, fh)
-            ):
+            if not (fx < px_end and fx + fw > px and
+                    fy < py_end and fy + fd > py and
+                    fz < pz_end and fz + fh > pz):
                 new_free_spaces.append(free_space)
                 continue
 
+            first_split = len(new_free_spaces)
+
             # Space to the right (positive x)
-            if fx + fw > px + pw:
+            if fx + fw > px_end:
                 new_space = FreeSpace(
-                    (px + pw, fy, fz),
-                    (fx + fw - (px + pw), fd, fh)
+                    (px_end, fy, fz),
+                    (fx + fw - px_end, fd, fh)
                 )
                 if new_space.volume() > 0:
                     new_free_spaces.append(new_space)
@@ -157,10 +195,10 @@ class PackingContainer:
                     new_free_spaces.append(new_space)
 
             # Space to the front (positive y)
-            if fy + fd > py + pd:
+            if fy + fd > py_end:
                 new_space = FreeSpace(
-                    (fx, py + pd, fz),
-                    (fw, fy + fd - (py + pd), fh)
+                    (fx, py_end, fz),
+                    (fw, fy + fd - py_end, fh)
                 )
                 if new_space.volume() > 0:
                     new_free_spaces.append(new_space)
@@ -175,10 +213,10 @@ class PackingContainer:
                     new_free_spaces.append(new_space)
 
             # Space above (positive z)
-            if fz + fh > pz + ph:
+            if fz + fh > pz_end:
                 new_space = FreeSpace(
-                    (fx, fy, pz + ph),
-                    (fw, fd, fz + fh - (pz + ph))
+                    (fx, fy, pz_end),
+                    (fw, fd, fz + fh - pz_end)
                 )
                 if new_space.volume() > 0:
                     new_free_spaces.append(new_space)
@@ -192,53 +230,56 @@ class PackingContainer:
                 if new_space.volume() > 0:
                     new_free_spaces.append(new_space)
 
-        self.free_spaces = self._prune_free_spaces(new_free_spaces)
-
-    def _boxes_intersect(self, box1: Tuple, box2: Tuple) -> bool:
-        """Check if two boxes (x, y, z, w, d, h) intersect."""
-        x1, y1, z1, w1, d1, h1 = box1
-        x2, y2, z2, w2, d2, h2 = box2
-
-        return (x1 < x2 + w2 and x1 + w1 > x2 and
-                y1 < y2 + d2 and y1 + d1 > y2 and
-                z1 < z2 + h2 and z1 + h1 > z2)
-
-    def _prune_free_spaces(self, spaces: List[FreeSpace]) -> List[FreeSpace]:
-        """Remove enclosed and duplicate spaces."""
-        pruned = []
-
-        for i, space1 in enumerate(spaces):
-            is_enclosed = False
-
-            for j, space2 in enumerate(spaces):
-                if i == j:
-                    continue
-
-                s1x, s1y, s1z = space1.position
-                s1w, s1d, s1h = space1.dimensions
-                s2x, s2y, s2z = space2.position
-                s2w, s2d, s2h = space2.dimensions
-
-                if (s2x <= s1x and s2y <= s1y and s2z <= s1z and
-                    s2x + s2w >= s1x + s1w and
-                    s2y + s2d >= s1y + s1d and
-                    s2z + s2h >= s1z + s1h and
-                    (s2x < s1x or s2y < s1y or s2z < s1z or
-                     s2x + s2w > s1x + s1w or
-                     s2y + s2d > s1y + s1d or
-                     s2z + s2h > s1z + s1h)):
-                    is_enclosed = True
-                    break
-
-            if not is_enclosed:
-                is_duplicate = False
-                for existing in pruned:
-                    if (space1.position == existing.position and
-                        space1.dimensions == existing.dimensions):
-                        is_duplicate = True
-                        break
-
-                if not is_duplicate:
-                    pruned.append(space1)
-
-        return pruned
+            split_indices.extend(range(first_split, len(new_free_spaces)))
+
+        pruned = self._prune_free_spaces(new_free_spaces, split_indices)
+        pruned.sort(key=FreeSpace.placement_key)
+        self.free_spaces = pruned
+
+    def _prune_free_spaces(self, spaces: List[FreeSpace],
+                           candidates: Optional[Sequence[int]] = None
+                           ) -> List[FreeSpace]:
+        """Remove enclosed and duplicate spaces.
+
+        A space is dropped if another, strictly larger space contains it, or
+        if an identical space appears earlier in the list. Containment of
+        every candidate against all spaces is tested at once with NumPy.
+
+        Args:
+            spaces: Free spaces to prune
+            candidates: Indices of the spaces that may be dropped (default:
+                all). The others must not be enclosed by any space in the list.
+
+        Returns:
+            The surviving spaces, in their original order
+        """
+        if candidates is None:
+            candidates = range(len(spaces))
+        if len(spaces) < 2 or not len(candidates):
+            return list(spaces)
+
+        rows = np.asarray(candidates)
+        bounds = np.array([space.position + space.dimensions for space in spaces])
+        lows = bounds[:, :3]
+        highs = lows + bounds[:, 3:]
+
+        # contains[k, j]: space j encloses candidate k
+        # inside[k, j]: candidate k encloses space j
+        contains = np.ones((len(rows), len(spaces)), dtype=bool)
+        inside = np.ones((len(rows), len(spaces)), dtype=bool)
+        for axis in range(3):
+            low = lows[:, axis]
+            high = highs[:, axis]
+            row_low = low[rows, np.newaxis]
+            row_high = high[rows, np.newaxis]
+            contains &= (low <= row_low) & (high >= row_high)
+            inside &= (low >= row_low) & (high <= row_high)
+
+        identical = contains & inside
+        enclosed = (contains & ~identical).any(axis=1)
+        earlier = np.arange(len(spaces)) < rows[:, np.newaxis]
+        duplicate = (identical & earlier).any(axis=1)
+
+        keep = np.ones(len(spaces), dtype=bool)
+        keep[rows[enclosed | duplicate]] = False
+        return [spaces[i] for i in np.flatnonzero(keep)]
@@ -2,25 +2,39 @@
 import json
 import csv
 import math
-from typing import Dict, Tuple
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 
 def load_original_boxes(filename: str) -> Dict[str, Dict]:
     """Load original box data from CSV."""
     boxes_by_label = {}
 
-    with open(filename, 'r') as f:
-        reader = csv.DictReader(f)
+    with open(filename, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        label_col = header.index('Box Label')
+        count_col = header.index('Count')
+        dim1_col = header.index('Dim 1 (mm)')
+        dim2_col = header.index('Dim 2.  (mm)')
+        dim3_col = header.index('Dim 3 (mm)')
+
         for row in reader:
-            label = row['Box Label']
-            count = int(row['Count'])
-            dim1 = math.ceil(float(row['Dim 1 (mm)']))
-            dim2 = math.ceil(float(row['Dim 2.  (mm)']))
-            dim3 = math.ceil(float(row['Dim 3 (mm)']))
+            if not row:
+                continue
+
+            label = row[label_col]
+            count = int(row[count_col])
+            dim1 = math.ceil(float(row[dim1_col]))
+            dim2 = math.ceil(float(row[dim2_col]))
+            dim3 = math.ceil(float(row[dim3_col]))
 
             boxes_by_label[label] = {
                 'count': count,
                 'dimensions': (dim1, dim2, dim3),
+                'sorted_dimensions': tuple(sorted((dim1, dim2, dim3))),
                 'volume': dim1 * dim2 * dim3
             }
 
@@ -42,6 +56,69 @@ def check_box_overlap(box1: Dict, box2: Dict) -> bool:
     return x_overlap and y_overlap and z_overlap
 
 
+def find_overlaps(boxes: List[Dict]) -> List[Tuple[int, int]]:
+    """Find every pair of placed boxes that overlap.
+
+    Uses sweep-and-prune on the x axis: with boxes sorted by their x start,
+    only boxes starting before another box ends along x can overlap it.
+    Those candidate pairs are then tested on all axes at once with NumPy;
+    the test is the same as ``check_box_overlap``.
+
+    Args:
+        boxes: Placed box dicts with 'position' and 'placed_dimensions'
+
+    Returns:
+        Index pairs (j, k) with j < k, in ascending order
+    """
+    if len(boxes) < 2:
+        return []
+
+    lows = np.array([box['position'] for box in boxes])
+    highs = lows + np.array([box['placed_dimensions'] for box in boxes])
+
+    order = np.argsort(lows[:, 0], kind='stable')
+    lows = lows[order]
+    highs = highs[order]
+
+    # Box i is paired with the boxes after it (in x order) that start
+    # before it ends, i.e. sorted positions i+1 .. ends[i]-1
+    first = np.arange(len(boxes))
+    ends = np.maximum(np.searchsorted(lows[:, 0], highs[:, 0], side='left'),
+                      first + 1)
+    counts = ends - first - 1
+    left = np.repeat(first, counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    right = left + 1 + offsets
+
+    overlap = np.all((lows[left] < highs[right]) & (highs[left] > lows[right]),
+                     axis=1)
+    pairs = np.sort(order[np.stack([left[overlap], right[overlap]], axis=1)],
+                    axis=1)
+    pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+    return [(int(j), int(k)) for j, k in pairs]
+
+
+def find_outside(boxes: List[Dict],
+                 container_dims: Tuple[int, int, int]) -> np.ndarray:
+    """Flag placed boxes that extend outside the container.
+
+    Args:
+        boxes: Placed box dicts with 'position' and 'placed_dimensions'
+        container_dims: Container (width, depth, height)
+
+    Returns:
+        Boolean array with True for each box not fully inside the container
+    """
+    if not boxes:
+        return np.zeros(0, dtype=bool)
+
+    lows = np.array([box['position'] for box in boxes])
+    highs = lows + np.array([box['placed_dimensions'] for box in boxes])
+
+    inside = (lows >= 0).all(axis=1) & (highs <= np.asarray(container_dims)).all(axis=1)
+    return ~inside
+
+
 def is_valid_rotation(original_dims: Tuple[int, int, int],
                       placed_dims: Tuple[int, int, int]) -> bool:
     """Check if placed dimensions are a valid rotation of original dimensions."""
@@ -72,15 +149,21 @@ def validate_solution(json_file: str, boxes_csv: str, containers_csv: str) -> bo
 
     original_boxes = load_original_boxes(boxes_csv)
 
-    with open(containers_csv, 'r') as f:
-        reader = csv.DictReader(f)
+    with open(containers_csv, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        label_col = header.index('Box Label')
+        dim1_col = header.index('Dim 1 (mm)')
+        dim2_col = header.index('Dim 2.  (mm)')
+        dim3_col = header.index('Dim 3 (mm)')
+
         container_types = {
-            row['Box Label']: (
-                int(row['Dim 1 (mm)']),
-                int(row['Dim 2.  (mm)']),
-                int(row['Dim 3 (mm)'])
+            row[label_col]: (
+                int(row[dim1_col]),
+                int(row[dim2_col]),
+                int(row[dim3_col])
             )
-            for row in reader
+            for row in reader if row
         }
 
     print(f"   Loaded {len(original_boxes)} box types")
@@ -89,12 +172,16 @@ def validate_solution(json_file: str, boxes_csv: str, containers_csv: str) -> bo
 
     all_valid = True
     total_boxes_in_solution = 0
-    boxes_in_solution = {}
+    boxes_in_solution = Counter()
+    calculated_total_volume = 0
+    calculated_total_available = 0
 
     print("\n2. Checking each container...")
     for i, container in enumerate(result['containers'], 1):
         print(f"\n   Container #{i}: {container['type']}")
         container_valid = True
+        calculated_total_volume += container['used_volume']
+        calculated_total_available += container['volume']
 
         if container['type'] not in container_types:
             print(f"      ERROR: Unknown container type '{container['type']}'")
@@ -113,61 +200,54 @@ def validate_solution(json_file: str, boxes_csv: str, containers_csv: str) -> bo
 
         boxes_in_container = container['boxes']
         total_boxes_in_solution += len(boxes_in_container)
+        boxes_in_solution.update(box['label'] for box in boxes_in_container)
+        outside = find_outside(boxes_in_container, container_dims)
+
+        # Collect per-box errors and print them together after the scan
+        errors = []
+        calculated_used_volume = 0
 
         for j, box in enumerate(boxes_in_container):
             label = box['label']
-            if label not in boxes_in_solution:
-                boxes_in_solution[label] = 0
-            boxes_in_solution[label] += 1
+            calculated_used_volume += box['volume']
 
             if label not in original_boxes:
-                print(f"      ERROR: Box #{j+1} has unknown label '{label}'")
-                all_valid = False
-                container_valid = False
+                errors.append(f"      ERROR: Box #{j+1} has unknown label '{label}'")
                 continue
 
-            orig_dims = original_boxes[label]['dimensions']
+            original = original_boxes[label]
+            orig_dims = original['dimensions']
 
-            if not is_valid_rotation(orig_dims, tuple(box['placed_dimensions'])):
-                print(f"      ERROR: Box #{j+1} ({label}) has invalid rotation")
-                print(f"         Original: {orig_dims}")
-                print(f"         Placed: {box['placed_dimensions']}")
-                all_valid = False
-                container_valid = False
+            # Same test as is_valid_rotation, with the original dimensions
+            # sorted once per box type
+            if tuple(sorted(box['placed_dimensions'])) != original['sorted_dimensions']:
+                errors.append(f"      ERROR: Box #{j+1} ({label}) has invalid rotation")
+                errors.append(f"         Original: {orig_dims}")
+                errors.append(f"         Placed: {box['placed_dimensions']}")
 
-            x, y, z = box['position']
-            w, d, h = box['placed_dimensions']
+            if outside[j]:
+                errors.append(f"      ERROR: Box #{j+1} ({label}) extends outside container")
 
-            if (x < 0 or y < 0 or z < 0 or
-                x + w > container_dims[0] or
-                y + d > container_dims[1] or
-                z + h > container_dims[2]):
-                print(f"      ERROR: Box #{j+1} ({label}) extends outside container")
-                all_valid = False
-                container_valid = False
+            if box['volume'] != original['volume']:
+                errors.append(f"      ERROR: Box #{j+1} ({label}) has incorrect volume")
 
-            expected_volume = orig_dims[0] * orig_dims[1] * orig_dims[2]
-            if box['volume'] != expected_volume:
-                print(f"      ERROR: Box #{j+1} ({label}) has incorrect volume")
-                all_valid = False
-                container_valid = False
+        if errors:
+            print("\n".join(errors))
+            all_valid = False
+            container_valid = False
 
         # Check for overlaps
         print(f"      Checking for overlaps among {len(boxes_in_container)} boxes...")
-        overlaps_found = False
-
-        for j in range(len(boxes_in_container)):
-            for k in range(j + 1, len(boxes_in_container)):
-                if check_box_overlap(boxes_in_container[j], boxes_in_container[k]):
-                    print(f"      ERROR: Overlap between boxes #{j+1} and #{k+1}")
-                    all_valid = False
-                    container_valid = False
-                    overlaps_found = True
+        overlaps = find_overlaps(boxes_in_container)
 
-        if not overlaps_found:
+        if overlaps:
+            print("\n".join(f"      ERROR: Overlap between boxes #{j+1} and #{k+1}"
+                            for j, k in overlaps))
+            all_valid = False
+            container_valid = False
+        else:
             print(f"      No overlaps detected")
 
-        calculated_used_volume = sum(b['volume'] for b in boxes_in_container)
         if calculated_used_volume != container['used_volume']:
             print(f"      ERROR: Used volume mismatch")
             all_valid = False
@@ -183,7 +263,7 @@ def validate_solution(json_file: str, boxes_csv: str, containers_csv: str) -> bo
 
     for label, data in original_boxes.items():
         expected_count = data['count']
-        actual_count = boxes_in_solution.get(label, 0)
+        actual_count = boxes_in_solution[label]
 
         if actual_count < expected_count:
             print(f"   ERROR: Missing boxes for '{label}'")
@@ -207,14 +287,12 @@ def validate_solution(json_file: str, boxes_csv: str, containers_csv: str) -> bo
     # Validate summary statistics
     print("\n4. Validating summary statistics...")
 
-    calculated_total_volume = sum(c['used_volume'] for c in result['containers'])
     if calculated_total_volume != result['total_volume_used']:
         print(f"   ERROR: Total volume used mismatch")
         all_valid = False
     else:
         print(f"   Total volume used: {result['total_volume_used']:,} mm3")
 
-    calculated_total_available = sum(c['volume'] for c in result['containers'])
     if calculated_total_available != result['total_volume_available']:
         print(f"   ERROR: Total volume available mismatch")
         all_valid = False
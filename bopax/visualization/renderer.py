@@ -1,6 +1,8 @@
 """3D Visualization of packing solutions."""
 import json
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional
 
 import matplotlib.pyplot as plt
@@ -18,42 +20,53 @@ def generate_color():
     return (r, g, b, 0.7)
 
 
+# Corners of the unit cube, bottom face then top face
+_UNIT_VERTICES = np.array([
+    [0, 0, 0],
+    [1, 0, 0],
+    [1, 1, 0],
+    [0, 1, 0],
+    [0, 0, 1],
+    [1, 0, 1],
+    [1, 1, 1],
+    [0, 1, 1]
+])
+
+# Vertex indices of the six faces: front, back, left, right, bottom, top
+_FACE_INDICES = np.array([
+    [0, 1, 5, 4],
+    [2, 3, 7, 6],
+    [0, 3, 7, 4],
+    [1, 2, 6, 5],
+    [0, 1, 2, 3],
+    [4, 5, 6, 7]
+])
+
+
 def create_box_vertices(position, dimensions):
     """Create vertices for a 3D box."""
-    x, y, z = position
-    w, d, h = dimensions
+    return np.asarray(position) + _UNIT_VERTICES * np.asarray(dimensions)
 
-    vertices = [
-        [x, y, z],
-        [x + w, y, z],
-        [x + w, y + d, z],
-        [x, y + d, z],
-        [x, y, z + h],
-        [x + w, y, z + h],
-        [x + w, y + d, z + h],
-        [x, y + d, z + h]
-    ]
 
-    return np.array(vertices)
+def create_box_faces(vertices):
+    """Create faces for a 3D box from vertices.
 
+    Returns:
+        Array of shape (6, 4, 3), one row of corner points per face
+    """
+    return vertices[_FACE_INDICES]
 
-def create_box_faces(vertices):
-    """Create faces for a 3D box from vertices."""
-    faces = [
-        [vertices[0], vertices[1], vertices[5], vertices[4]],
-        [vertices[2], vertices[3], vertices[7], vertices[6]],
-        [vertices[0], vertices[3], vertices[7], vertices[4]],
-        [vertices[1], vertices[2], vertices[6], vertices[5]],
-        [vertices[0], vertices[1], vertices[2], vertices[3]],
-        [vertices[4], vertices[5], vertices[6], vertices[7]]
-    ]
 
-    return faces
+def create_container_axes():
+    """Create a figure with 3D axes sized for a container plot."""
+    fig = plt.figure(figsize=(14, 10))
+    return fig.add_subplot(111, projection='3d')
 
 
 def plot_container(container_data: Dict, container_id: int,
                    azimuth: int = 45,
-                   box_type_colors: Optional[Dict] = None):
+                   box_type_colors: Optional[Dict] = None,
+                   ax=None):
     """Create a 3D plot for a single container.
 
     Args:
@@ -61,12 +74,17 @@ def plot_container(container_data: Dict, container_id: int,
         container_id: ID number for the container
         azimuth: Viewing angle for the 3D plot
         box_type_colors: Optional dict of colors for each box type
+        ax: Optional 3D axes from ``create_container_axes`` to clear and
+            draw into; a new figure is created if omitted
 
     Returns:
         Tuple of (figure, box_type_colors dict)
     """
-    fig = plt.figure(figsize=(14, 10))
-    ax = fig.add_subplot(111, projection='3d')
+    if ax is None:
+        ax = create_container_axes()
+    else:
+        ax.cla()
+    fig = ax.figure
 
     container_dims = container_data['dimensions']
     container_label = container_data['type']
@@ -82,32 +100,33 @@ def plot_container(container_data: Dict, container_id: int,
     if box_type_colors is None:
         box_type_colors = {}
 
-    # Draw each packed box
-    for box in container_data['boxes']:
-        position = tuple(box['position'])
-        dimensions = tuple(box['placed_dimensions'])
-        box_label = box['label']
-
-        if box_label not in box_type_colors:
-            box_type_colors[box_label] = generate_color()
-
-        color = box_type_colors[box_label]
-
-        vertices = create_box_vertices(position, dimensions)
-        faces = create_box_faces(vertices)
-
-        box_poly = Poly3DCollection(faces, alpha=0.7, facecolor=color,
-                                    edgecolor='black', linewidth=0.5)
-        ax.add_collection3d(box_poly)
-
-        # Add label at box center
-        center_x = position[0] + dimensions[0] / 2
-        center_y = position[1] + dimensions[1] / 2
-        center_z = position[2] + dimensions[2] / 2
-
-        short_label = f"#{box['box_id']}"
-        ax.text(center_x, center_y, center_z, short_label,
-               fontsize=7, ha='center', va='center')
+    boxes = container_data['boxes']
+
+    for box in boxes:
+        if box['label'] not in box_type_colors:
+            box_type_colors[box['label']] = generate_color()
+
+    if boxes:
+        # Vertices and faces of all packed boxes at once, drawn as one collection
+        positions = np.array([box['position'] for box in boxes])
+        dimensions = np.array([box['placed_dimensions'] for box in boxes])
+        vertices = (positions[:, np.newaxis, :] +
+                    _UNIT_VERTICES * dimensions[:, np.newaxis, :])
+        box_faces = vertices[:, _FACE_INDICES].reshape(-1, 4, 3)
+        face_colors = np.repeat([box_type_colors[box['label']] for box in boxes],
+                                len(_FACE_INDICES), axis=0)
+
+        # Add labels at box centers
+        centers = positions + dimensions / 2
+        for box, (center_x, center_y, center_z) in zip(boxes, centers):
+            short_label = f"#{box['box_id']}"
+            ax.text(center_x, center_y, center_z, short_label,
+                   fontsize=7, ha='center', va='center')
+
+        box_polys = Poly3DCollection(box_faces, alpha=0.7, facecolors=face_colors,
+                                     edgecolor='black', linewidth=0.5,
+                                     rasterized=True)
+        ax.add_collection3d(box_polys)
 
     ax.set_xlabel('Width (mm)', fontsize=10)
     ax.set_ylabel('Depth (mm)', fontsize=10)
@@ -140,7 +159,7 @@ def plot_container(container_data: Dict, container_id: int,
 
     ax.view_init(elev=20, azim=azimuth)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     return fig, box_type_colors
 
@@ -238,21 +257,64 @@ def create_summary_plot(result: Dict):
     return fig
 
 
+def _use_agg_backend():
+    """Switch a plotting worker process to the non-interactive Agg backend."""
+    plt.switch_backend('Agg')
+
+
+def _save_container_views(container: Dict, output_dir: str, dpi: int,
+                          view_axes=(None, None)) -> List[str]:
+    """Plot both views of a container and save them as PNG files.
+
+    Args:
+        container: Container information dict from packing result
+        output_dir: Directory to save the images in
+        dpi: Resolution of saved images
+        view_axes: Axes to reuse for the two views; new figures are created
+            and closed for any that are None
+
+    Returns:
+        Paths of the saved images
+    """
+    container_id = container['id']
+    box_colors = None
+    paths = []
+
+    for view, (azimuth, ax) in enumerate(zip((45, 225), view_axes), 1):
+        fig, box_colors = plot_container(container, container_id, azimuth=azimuth,
+                                         box_type_colors=box_colors, ax=ax)
+
+        path = os.path.join(output_dir, f"container_{container_id:02d}_view{view}.png")
+        fig.savefig(path, dpi=dpi, bbox_inches='tight')
+        paths.append(path)
+
+        if ax is None:
+            plt.close(fig)
+
+    return paths
+
+
 def visualize_packing(json_file: str = 'packing_result.json',
                       save_images: bool = True,
-                      output_dir: str = '.'):
+                      output_dir: str = '.',
+                      dpi: int = 150,
+                      max_workers: int = 1):
     """Main visualization function.
 
     Args:
         json_file: Path to the packing result JSON file
         save_images: Whether to save images to files
         output_dir: Directory to save output images
+        dpi: Resolution of saved images; lower values save faster
+        max_workers: Number of processes used to save container images in
+            parallel; 1 renders them serially in this process
 
     Returns:
-        List of generated figure objects
+        List of generated figure objects. When saving images, the two
+        container views are drawn in one reused figure each, so only the
+        summary and those two figures are returned; with several workers
+        only the summary figure is returned.
     """
-    import os
-
     print(f"Loading packing results from {json_file}...")
 
     with open(json_file, 'r') as f:
@@ -269,34 +331,47 @@ def visualize_packing(json_file: str = 'packing_result.json',
 
     if save_images:
         summary_path = os.path.join(output_dir, 'packing_summary.png')
-        summary_fig.savefig(summary_path, dpi=150, bbox_inches='tight')
+        summary_fig.savefig(summary_path, dpi=dpi, bbox_inches='tight')
         print(f"Saved {summary_path}")
 
-    # Create individual container plots
-    for container in result['containers']:
-        container_id = container['id']
-        print(f"\nCreating 3D visualizations for Container #{container_id}...")
-
-        fig1, box_colors = plot_container(container, container_id, azimuth=45)
-        figures.append(fig1)
-
-        if save_images:
-            filename1 = os.path.join(output_dir, f"container_{container_id:02d}_view1.png")
-            fig1.savefig(filename1, dpi=150, bbox_inches='tight')
-            print(f"Saved {filename1}")
+    containers = result['containers']
 
-        plt.close(fig1)
+    # Create individual container plots
+    if not save_images:
+        for container in containers:
+            container_id = container['id']
+            print(f"\nCreating 3D visualizations for Container #{container_id}...")
+
+            fig1, box_colors = plot_container(container, container_id, azimuth=45)
+            fig2, _ = plot_container(container, container_id, azimuth=225,
+                                     box_type_colors=box_colors)
+            figures.extend([fig1, fig2])
+            plt.close(fig1)
+            plt.close(fig2)
+
+    elif max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_use_agg_backend) as executor:
+            jobs = [executor.submit(_save_container_views, container, output_dir, dpi)
+                    for container in containers]
+
+            for container, job in zip(containers, jobs):
+                print(f"\nCreating 3D visualizations for Container #{container['id']}...")
+                for path in job.result():
+                    print(f"Saved {path}")
 
-        fig2, _ = plot_container(container, container_id, azimuth=225,
-                                 box_type_colors=box_colors)
-        figures.append(fig2)
+    else:
+        # Each view reuses one figure for all containers
+        view_axes = (create_container_axes(), create_container_axes())
 
-        if save_images:
-            filename2 = os.path.join(output_dir, f"container_{container_id:02d}_view2.png")
-            fig2.savefig(filename2, dpi=150, bbox_inches='tight')
-            print(f"Saved {filename2}")
+        for container in containers:
+            print(f"\nCreating 3D visualizations for Container #{container['id']}...")
+            for path in _save_container_views(container, output_dir, dpi, view_axes):
+                print(f"Saved {path}")
 
-        plt.close(fig2)
+        for ax in view_axes:
+            figures.append(ax.figure)
+            plt.close(ax.figure)
 
     print("\n" + "="*60)
     print("Visualization complete!")
@@ -0,0 +1,19 @@
+"""Shared fixtures for BoPax tests."""
+import os
+import pytest
+from bopax.loaders import load_boxes_from_csv, load_containers_from_csv
+
+EXAMPLES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'examples')
+
+
+@pytest.fixture(scope="session")
+def sample_boxes():
+    """Boxes from examples/sample_boxes.csv, parsed once per session."""
+    return load_boxes_from_csv(os.path.join(EXAMPLES_DIR, 'sample_boxes.csv'))
+
+
+@pytest.fixture(scope="session")
+def sample_containers():
+    """Containers from examples/sample_containers.csv, parsed once per session."""
+    return load_containers_from_csv(os.path.join(EXAMPLES_DIR, 'sample_containers.csv'))
@@ -1,6 +1,8 @@
 """Tests for BoPax packing algorithms."""
+import logging
+import numpy as np
 import pytest
-from bopax.models import Box
+from bopax.models import Box, PackingContainer
 from bopax.algorithms import (
     BasePacker,
     ExhaustivePacker,
@@ -11,77 +13,113 @@ from bopax.algorithms import (
 
 
 # Test fixtures
-@pytest.fixture
+# Packers only read their inputs, so the fixtures are built once per module
+# and returned as tuples to guard against accidental mutation.
+@pytest.fixture(scope="module")
 def simple_boxes():
     """Create a simple set of boxes for testing."""
-    return [
+    return (
         Box("Small", (50, 50, 50), box_id=1),
         Box("Small", (50, 50, 50), box_id=2),
         Box("Medium", (100, 100, 100), box_id=3),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def single_box():
     """Create a single box for testing."""
-    return [Box("Test", (100, 100, 100), box_id=1)]
+    return (Box("Test", (100, 100, 100), box_id=1),)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def containers():
     """Create container types for testing."""
-    return [
+    return (
         ("Small", (150, 150, 150)),
         ("Medium", (300, 300, 300)),
         ("Large", (500, 500, 500)),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def small_container():
     """Create a small container for tight packing tests."""
-    return [("Small", (100, 100, 100))]
+    return (("Small", (100, 100, 100)),)
 
 
-class TestGreedyPacker:
-    """Tests for the GreedyPacker algorithm."""
+@pytest.fixture(scope="module",
+                params=[GreedyPacker, OptimalPacker, HybridPacker, ExhaustivePacker],
+                ids=lambda cls: cls.__name__)
+def packer_cls(request):
+    """Each packer class in turn."""
+    return request.param
 
-    def test_pack_single_box(self, single_box, containers):
-        """Test packing a single box."""
-        packer = GreedyPacker(single_box, containers)
-        result = packer.pack()
 
-        assert result is not None
-        assert result['total_containers'] == 1
-        assert len(result['containers'][0]['boxes']) == 1
+@pytest.fixture(scope="module")
+def single_result(packer_cls, single_box, containers):
+    """Result of packing the single box, computed once per packer."""
+    return packer_cls(single_box, containers).pack()
 
-    def test_pack_multiple_boxes(self, simple_boxes, containers):
-        """Test packing multiple boxes."""
-        packer = GreedyPacker(simple_boxes, containers)
-        result = packer.pack()
 
-        assert result is not None
-        total_boxes = sum(len(c['boxes']) for c in result['containers'])
+@pytest.fixture(scope="module")
+def simple_result(packer_cls, simple_boxes, containers):
+    """Result of packing the simple boxes, computed once per packer."""
+    return packer_cls(simple_boxes, containers).pack()
+
+
+def check_no_overlaps(result):
+    """Assert that no two boxes in the same container overlap."""
+    for container in result['containers']:
+        boxes = container['boxes']
+        if len(boxes) < 2:
+            continue
+        pos = np.array([b['position'] for b in boxes])
+        end = pos + np.array([b['placed_dimensions'] for b in boxes])
+
+        # Pairwise interval overlap on every axis, upper triangle only
+        overlaps = ((pos[:, None, :] < end[None, :, :]) &
+                    (end[:, None, :] > pos[None, :, :])).all(axis=2)
+        overlaps = np.triu(overlaps, k=1)
+
+        for i, j in np.argwhere(overlaps):
+            pytest.fail(f"Boxes {boxes[i]['box_id']} and {boxes[j]['box_id']} overlap")
+
+
+class TestAllPackers:
+    """Tests every packer must pass, sharing one pack() per scenario."""
+
+    def test_pack_single_box(self, single_result):
+        """Test packing a single box."""
+        assert single_result is not None
+        assert single_result['total_containers'] == 1
+        assert len(single_result['containers'][0]['boxes']) == 1
+
+    def test_pack_multiple_boxes(self, simple_result):
+        """Test packing multiple boxes."""
+        assert simple_result is not None
+        total_boxes = sum(len(c['boxes']) for c in simple_result['containers'])
         assert total_boxes == 3
 
-    def test_pack_result_structure(self, single_box, containers):
-        """Test that result has expected structure."""
-        packer = GreedyPacker(single_box, containers)
-        result = packer.pack()
+    def test_pack_valid_utilization(self, simple_result):
+        """Test that the packer reports valid utilization."""
+        assert 0 < simple_result['overall_utilization'] <= 1.0
 
-        assert 'containers' in result
-        assert 'total_containers' in result
-        assert 'container_counts' in result
-        assert 'total_volume_used' in result
-        assert 'total_volume_available' in result
-        assert 'overall_utilization' in result
+    def test_pack_no_overlaps(self, simple_result):
+        """Test that the packer produces no overlapping boxes."""
+        check_no_overlaps(simple_result)
 
-    def test_pack_container_info(self, single_box, containers):
+    def test_pack_result_structure(self, single_result):
+        """Test that result has expected structure."""
+        assert 'containers' in single_result
+        assert 'total_containers' in single_result
+        assert 'container_counts' in single_result
+        assert 'total_volume_used' in single_result
+        assert 'total_volume_available' in single_result
+        assert 'overall_utilization' in single_result
+
+    def test_pack_container_info(self, single_result):
         """Test that container info has expected structure."""
-        packer = GreedyPacker(single_box, containers)
-        result = packer.pack()
-
-        container = result['containers'][0]
+        container = single_result['containers'][0]
         assert 'id' in container
         assert 'type' in container
         assert 'dimensions' in container
@@ -90,12 +128,9 @@ class TestGreedyPacker:
         assert 'utilization' in container
         assert 'boxes' in container
 
-    def test_pack_box_info(self, single_box, containers):
+    def test_pack_box_info(self, single_result):
         """Test that packed box info has expected structure."""
-        packer = GreedyPacker(single_box, containers)
-        result = packer.pack()
-
-        box = result['containers'][0]['boxes'][0]
+        box = single_result['containers'][0]['boxes'][0]
         assert 'label' in box
         assert 'box_id' in box
         assert 'original_dimensions' in box
@@ -103,6 +138,18 @@ class TestGreedyPacker:
         assert 'position' in box
         assert 'volume' in box
 
+    @pytest.mark.parametrize("packer_class", [GreedyPacker, OptimalPacker, HybridPacker])
+    def test_pack_empty_boxes(self, packer_class, containers):
+        """Test packing with no boxes."""
+        result = packer_class([], containers).pack()
+
+        assert result is not None
+        assert result['total_containers'] == 0
+
+
+class TestGreedyPacker:
+    """Tests for the GreedyPacker algorithm."""
+
     def test_pack_utilization_calculation(self, single_box, small_container):
         """Test utilization calculation is correct."""
         packer = GreedyPacker(single_box, small_container)
@@ -114,14 +161,6 @@ class TestGreedyPacker:
         # Utilization should be 100%
         assert result['overall_utilization'] == 1.0
 
-    def test_pack_empty_boxes(self, containers):
-        """Test packing with no boxes."""
-        packer = GreedyPacker([], containers)
-        result = packer.pack()
-
-        assert result is not None
-        assert result['total_containers'] == 0
-
     def test_pack_box_too_large(self):
         """Test when box doesn't fit in any container."""
         boxes = [Box("Huge", (1000, 1000, 1000), box_id=1)]
@@ -148,80 +187,58 @@ class TestGreedyPacker:
 class TestOptimalPacker:
     """Tests for the OptimalPacker algorithm."""
 
-    def test_pack_single_box(self, single_box, containers):
-        """Test packing a single box."""
-        packer = OptimalPacker(single_box, containers)
-        result = packer.pack()
+    def test_pack_with_workers(self, simple_boxes, containers):
+        """Test that parallel strategies give the same result as serial."""
+        serial = OptimalPacker(simple_boxes, containers).pack()
+        parallel = OptimalPacker(simple_boxes, containers, max_workers=2).pack()
 
-        assert result is not None
-        assert result['total_containers'] == 1
+        assert parallel == serial
 
-    def test_pack_multiple_boxes(self, simple_boxes, containers):
-        """Test packing multiple boxes."""
+    def test_pack_logs_progress(self, simple_boxes, containers, caplog):
+        """Test that strategy progress goes to the logger, not stdout."""
         packer = OptimalPacker(simple_boxes, containers)
-        result = packer.pack()
+        with caplog.at_level(logging.INFO, logger="bopax.algorithms.optimal"):
+            packer.pack()
 
-        assert result is not None
-        total_boxes = sum(len(c['boxes']) for c in result['containers'])
-        assert total_boxes == 3
-
-    def test_pack_tries_multiple_strategies(self, simple_boxes, containers):
-        """Test that OptimalPacker produces a result."""
-        packer = OptimalPacker(simple_boxes, containers)
-        result = packer.pack()
+        assert "Best strategy achieved" in caplog.text
 
-        # Should find some solution
-        assert result is not None
-        assert result['overall_utilization'] > 0
+    def test_pack_box_too_large(self):
+        """Test when one box doesn't fit in any container."""
+        boxes = [
+            Box("Small", (50, 50, 50), box_id=1),
+            Box("Huge", (1000, 1000, 1000), box_id=2),
+        ]
+        containers = [("Tiny", (100, 100, 100))]
 
-    def test_pack_empty_boxes(self, containers):
-        """Test packing with no boxes."""
-        packer = OptimalPacker([], containers)
+        packer = OptimalPacker(boxes, containers)
         result = packer.pack()
 
-        assert result is not None
-        assert result['total_containers'] == 0
+        assert result is None
 
 
 class TestHybridPacker:
     """Tests for the HybridPacker algorithm."""
 
-    def test_pack_single_box(self, single_box, containers):
-        """Test packing a single box."""
-        packer = HybridPacker(single_box, containers)
+    def test_pack_with_max_attempts(self, simple_boxes, containers):
+        """Test packing with custom max_attempts."""
+        packer = HybridPacker(simple_boxes, containers, max_attempts_per_container=1000)
         result = packer.pack()
 
         assert result is not None
-        assert result['total_containers'] == 1
 
-    def test_pack_multiple_boxes(self, simple_boxes, containers):
-        """Test packing multiple boxes."""
-        packer = HybridPacker(simple_boxes, containers)
+    def test_pack_with_workers(self, simple_boxes, containers):
+        """Test packing with container types evaluated in worker processes."""
+        packer = HybridPacker(simple_boxes, containers, max_workers=2)
         result = packer.pack()
 
         assert result is not None
         total_boxes = sum(len(c['boxes']) for c in result['containers'])
         assert total_boxes == 3
 
-    def test_pack_with_max_attempts(self, simple_boxes, containers):
-        """Test packing with custom max_attempts."""
-        packer = HybridPacker(simple_boxes, containers, max_attempts_per_container=1000)
-        result = packer.pack()
-
-        assert result is not None
-
 
 class TestExhaustivePacker:
     """Tests for the ExhaustivePacker algorithm."""
 
-    def test_pack_single_box(self, single_box, containers):
-        """Test packing a single box."""
-        packer = ExhaustivePacker(single_box, containers)
-        result = packer.pack()
-
-        assert result is not None
-        assert result['total_containers'] == 1
-
     def test_pack_few_boxes(self):
         """Test packing a few boxes (exhaustive is slow)."""
         boxes = [
@@ -236,80 +253,46 @@ class TestExhaustivePacker:
         assert result is not None
         assert result['total_containers'] == 1
 
+    def test_pack_volume_bound(self):
+        """Test packing when volume alone requires several containers."""
+        boxes = [Box("Cube", (100, 100, 100), box_id=i) for i in range(1, 4)]
+        containers = [("Exact", (100, 100, 100))]
 
-class TestPackerComparison:
-    """Tests comparing different packer algorithms."""
+        packer = ExhaustivePacker(boxes, containers)
+        result = packer.pack()
 
-    def test_all_packers_find_solution(self, simple_boxes, containers):
-        """Test that all packers can solve the same problem."""
-        packers = [
-            GreedyPacker(simple_boxes, containers),
-            OptimalPacker(simple_boxes, containers),
-            HybridPacker(simple_boxes, containers),
-        ]
+        assert result is not None
+        assert result['total_containers'] == 3
 
-        for packer in packers:
-            result = packer.pack()
-            assert result is not None, f"{packer.__class__.__name__} failed"
-            total_boxes = sum(len(c['boxes']) for c in result['containers'])
-            assert total_boxes == 3
-
-    def test_all_packers_valid_utilization(self, simple_boxes, containers):
-        """Test that all packers report valid utilization."""
-        packers = [
-            GreedyPacker(simple_boxes, containers),
-            OptimalPacker(simple_boxes, containers),
-            HybridPacker(simple_boxes, containers),
-        ]
+    def test_restore_container_state(self):
+        """Test that restoring undoes a placement."""
+        packer = ExhaustivePacker([], [("Medium", (200, 200, 200))])
+        container = PackingContainer("Medium", (200, 200, 200))
+        container.place_box(Box("A", (50, 50, 50), box_id=1), (0, 0, 0), (50, 50, 50))
+        placed_before = list(container.placed_boxes)
+        spaces_before = list(container.free_spaces)
 
-        for packer in packers:
-            result = packer.pack()
-            assert 0 <= result['overall_utilization'] <= 1.0
+        state = packer._save_container_state(container)
+        container.place_box(Box("B", (50, 50, 50), box_id=2), (50, 0, 0), (50, 50, 50))
+        packer._restore_container_state(container, state)
+
+        assert container.placed_boxes == placed_before
+        assert container.free_spaces == spaces_before
 
 
 class TestNoOverlaps:
     """Tests to verify no box overlaps in packing results."""
 
-    def test_greedy_no_overlaps(self, simple_boxes, containers):
-        """Test that GreedyPacker produces no overlapping boxes."""
-        packer = GreedyPacker(simple_boxes, containers)
-        result = packer.pack()
-        self._check_no_overlaps(result)
-
-    def test_optimal_no_overlaps(self, simple_boxes, containers):
-        """Test that OptimalPacker produces no overlapping boxes."""
-        packer = OptimalPacker(simple_boxes, containers)
-        result = packer.pack()
-        self._check_no_overlaps(result)
+    def test_simple_update_no_overlaps(self, containers):
+        """Test free-space placement stays overlap-free with many boxes."""
+        boxes = [
+            Box(f"Box{i % 4}", (40 + 15 * (i % 4), 60 + 10 * (i % 3), 50 + 20 * (i % 5)),
+                box_id=i)
+            for i in range(1, 31)
+        ]
 
-    def test_hybrid_no_overlaps(self, simple_boxes, containers):
-        """Test that HybridPacker produces no overlapping boxes."""
-        packer = HybridPacker(simple_boxes, containers)
-        result = packer.pack()
-        self._check_no_overlaps(result)
-
-    def _check_no_overlaps(self, result):
-        """Helper to check for overlaps in a result."""
-        if result is None:
-            return
-
-        for container in result['containers']:
-            boxes = container['boxes']
-            for i, box1 in enumerate(boxes):
-                for j, box2 in enumerate(boxes):
-                    if i >= j:
-                        continue
-
-                    # Check overlap
-                    x1, y1, z1 = box1['position']
-                    w1, d1, h1 = box1['placed_dimensions']
-                    x2, y2, z2 = box2['position']
-                    w2, d2, h2 = box2['placed_dimensions']
-
-                    x_overlap = x1 < x2 + w2 and x1 + w1 > x2
-                    y_overlap = y1 < y2 + d2 and y1 + d1 > y2
-                    z_overlap = z1 < z2 + h2 and z1 + h1 > z2
-
-                    overlaps = x_overlap and y_overlap and z_overlap
-                    assert not overlaps, \
-                        f"Boxes {box1['box_id']} and {box2['box_id']} overlap"
+        for packer in [GreedyPacker(boxes, containers),
+                       OptimalPacker(boxes, containers)]:
+            result = packer.pack()
+            assert result is not None
+            check_no_overlaps(result)
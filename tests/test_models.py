@@ -1,4 +1,5 @@
 """Tests for BoPax model classes."""
+from itertools import permutations
 import pytest
 from bopax.models import Box, PlacedBox, FreeSpace, PackingContainer
 
@@ -28,7 +29,7 @@ class TestBox:
         box = Box("Test", (100, 200, 300))
         rotations = box.get_rotations()
         assert len(rotations) == 6
-        assert len(set(rotations)) == 6  # All unique
+        assert set(rotations) == set(permutations((100, 200, 300)))
 
     def test_box_rotations_cube(self):
         """Test that cube has only 1 unique rotation."""
@@ -42,6 +43,26 @@ class TestBox:
         box = Box("Square Prism", (100, 100, 200))
         rotations = box.get_rotations()
         assert len(rotations) == 3
+        assert set(rotations) == {(100, 100, 200), (100, 200, 100), (200, 100, 100)}
+
+    def test_box_rotations_cached(self):
+        """Test that rotations are computed once per box."""
+        box = Box("Test", (100, 200, 300))
+        assert box.get_rotations() is box.get_rotations()
+
+    def test_box_rotations_shared(self):
+        """Test that boxes with equal dimensions share one rotation tuple."""
+        box1 = Box("Test", (100, 200, 300), box_id=1)
+        box2 = Box("Test", (100, 200, 300), box_id=2)
+        assert box1.get_rotations() is box2.get_rotations()
+
+    def test_box_identity(self):
+        """Test that boxes compare by identity, not by field values."""
+        box1 = Box("Test", (100, 200, 300), box_id=1)
+        box2 = Box("Test", (100, 200, 300), box_id=1)
+        assert box1 == box1
+        assert box1 != box2
+        assert len({box1, box2}) == 2
 
     def test_box_default_id(self):
         """Test default box_id is 0."""
@@ -140,6 +161,11 @@ class TestFreeSpace:
         assert not space.can_fit((100, 150, 100))
         assert not space.can_fit((100, 100, 150))
 
+    def test_placement_key(self):
+        """Test placement key orders by z, then y, then x."""
+        space = FreeSpace((10, 20, 30), (100, 100, 100))
+        assert space.placement_key() == (30, 20, 10)
+
     def test_can_fit_one_dimension_too_large(self):
         """Test can_fit when only one dimension is too large."""
         space = FreeSpace((0, 0, 0), (100, 200, 300))
@@ -248,6 +274,36 @@ class TestPackingContainer:
         assert result is False
         assert len(container.placed_boxes) == 1
 
+    def test_free_spaces_in_placement_order(self):
+        """Test free spaces stay sorted bottom-back-left first."""
+        container = PackingContainer("Test", (300, 300, 300))
+        box = Box("Box1", (100, 100, 100), box_id=1)
+        container.place_box(box, (0, 0, 0), (100, 100, 100))
+        keys = [space.placement_key() for space in container.free_spaces]
+        assert keys == sorted(keys)
+
+    def test_prune_free_spaces(self):
+        """Test pruning drops enclosed and duplicate spaces."""
+        container = PackingContainer("Test", (300, 300, 300))
+        outer = FreeSpace((0, 0, 0), (200, 200, 200))
+        inner = FreeSpace((50, 50, 50), (100, 100, 100))
+        separate = FreeSpace((200, 0, 0), (100, 100, 100))
+        duplicate = FreeSpace((200, 0, 0), (100, 100, 100))
+
+        pruned = container._prune_free_spaces([inner, outer, separate, duplicate])
+        assert pruned == [outer, separate]
+        assert pruned[1] is separate
+
+    def test_prune_free_spaces_candidates(self):
+        """Test pruning only considers dropping the candidate spaces."""
+        container = PackingContainer("Test", (300, 300, 300))
+        kept = FreeSpace((0, 0, 0), (200, 200, 200))
+        enclosed = FreeSpace((0, 0, 0), (100, 100, 100))
+        split = FreeSpace((200, 0, 0), (100, 300, 300))
+
+        pruned = container._prune_free_spaces([kept, enclosed, split], [1, 2])
+        assert pruned == [kept, split]
+
     def test_remove_last(self):
         """Test removing last placed box."""
         container = PackingContainer("Test", (300, 300, 300))
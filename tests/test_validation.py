@@ -0,0 +1,99 @@
+"""Tests for BoPax solution validation."""
+import os
+import tempfile
+from bopax.validation.validator import (
+    check_box_overlap,
+    find_outside,
+    find_overlaps,
+    load_original_boxes
+)
+
+
+def placed(position, dimensions):
+    """Build a placed box dict as found in a packing result."""
+    return {'position': list(position), 'placed_dimensions': list(dimensions)}
+
+
+class TestFindOverlaps:
+    """Tests for the find_overlaps function."""
+
+    def test_no_boxes(self):
+        """Test that fewer than two boxes cannot overlap."""
+        assert find_overlaps([]) == []
+        assert find_overlaps([placed((0, 0, 0), (10, 10, 10))]) == []
+
+    def test_touching_boxes(self):
+        """Test that boxes sharing a face do not overlap."""
+        boxes = [
+            placed((0, 0, 0), (10, 10, 10)),
+            placed((10, 0, 0), (10, 10, 10)),
+            placed((0, 0, 10), (20, 10, 10)),
+        ]
+        assert find_overlaps(boxes) == []
+
+    def test_overlapping_pairs(self):
+        """Test that overlapping pairs are reported in ascending order."""
+        boxes = [
+            placed((0, 0, 0), (10, 10, 10)),
+            placed((50, 50, 50), (10, 10, 10)),
+            placed((5, 5, 5), (10, 10, 10)),
+            placed((55, 0, 0), (10, 60, 60)),
+        ]
+        assert find_overlaps(boxes) == [(0, 2), (1, 3)]
+
+    def test_matches_pairwise_check(self):
+        """Test agreement with check_box_overlap on a grid of boxes."""
+        boxes = [placed((x, y, z), (15, 10, 20))
+                 for x in range(0, 40, 12)
+                 for y in range(0, 30, 10)
+                 for z in range(0, 40, 25)]
+
+        expected = [(j, k)
+                    for j in range(len(boxes))
+                    for k in range(j + 1, len(boxes))
+                    if check_box_overlap(boxes[j], boxes[k])]
+        assert expected
+        assert find_overlaps(boxes) == expected
+
+
+class TestFindOutside:
+    """Tests for the find_outside function."""
+
+    def test_no_boxes(self):
+        """Test an empty container."""
+        assert find_outside([], (100, 100, 100)).tolist() == []
+
+    def test_flags_boxes_outside(self):
+        """Test that only boxes crossing a container wall are flagged."""
+        boxes = [
+            placed((0, 0, 0), (100, 100, 100)),
+            placed((50, 0, 0), (60, 10, 10)),
+            placed((0, -1, 0), (10, 10, 10)),
+            placed((0, 0, 90), (10, 10, 10)),
+        ]
+        outside = find_outside(boxes, (100, 100, 100))
+        assert outside.tolist() == [False, True, True, False]
+
+
+class TestLoadOriginalBoxes:
+    """Tests for the load_original_boxes function."""
+
+    def test_load_boxes(self):
+        """Test loading box types keyed by label, skipping blank lines."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write("Box Label,Count,Dim 1 (mm),Dim 2.  (mm),Dim 3 (mm)\n")
+            f.write("Box A,2,100,200,300\n")
+            f.write("\n")
+            f.write("Box B,1,10.2,30,20\n")
+            temp_file = f.name
+
+        try:
+            boxes = load_original_boxes(temp_file)
+            assert boxes['Box A']['count'] == 2
+            assert boxes['Box A']['dimensions'] == (100, 200, 300)
+            assert boxes['Box A']['sorted_dimensions'] == (100, 200, 300)
+            assert boxes['Box B']['dimensions'] == (11, 30, 20)
+            assert boxes['Box B']['sorted_dimensions'] == (11, 20, 30)
+            assert boxes['Box B']['volume'] == 11 * 20 * 30
+        finally:
+            os.unlink(temp_file)